@@ -0,0 +1,275 @@
+import os
+import queue
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
+import pygame
+
+# ============== Gerenciador de assets da visual novel ==============
+# As imagens são carregadas e redimensionadas numa thread de prefetch; a
+# conversão para o formato do display (convert/convert_alpha) é feita na
+# thread principal, em process_pending, algumas por frame. O cache tem um
+# limite de memória e descarta as imagens usadas há mais tempo (LRU).
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+BACKGROUND = "backgrounds"
+CHARACTER = "characters"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+MEMORY_LIMIT = 128 * 1024 * 1024 # bytes
+SPRITE_HEIGHT_RATIO = 0.45 # Altura dos personagens em relação à tela
+
+def asset_slug(name: str) -> str:
+    """Nome de arquivo de um asset: "Coruja Sábia" -> "coruja_sabia" """
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return "_".join(ascii_name.lower().replace("-", " ").split())
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+class AssetManager:
+    def __init__(self, screen_size: Tuple[int, int], asset_dir: str = ASSET_DIR, memory_limit: int = MEMORY_LIMIT,
+                 placeholder_colors: Optional[Dict[str, Tuple[int, int, int]]] = None):
+        self.screen_size = screen_size
+        self.asset_dir = asset_dir
+        self.memory_limit = memory_limit
+        # Cores sólidas usadas enquanto não existe arte para um fundo
+        self.placeholder_colors = placeholder_colors or {}
+
+        self.cache: "OrderedDict[Tuple[str, str], pygame.Surface]" = OrderedDict()
+        self.memory = 0
+        self.missing: Set[Tuple[str, str]] = set()
+
+        self.lock = threading.Lock()
+        self.pending: Dict[Tuple[str, str], Optional[pygame.Surface]] = {}
+        self.in_flight: Set[Tuple[str, str]] = set() # Na fila ou sendo carregados pela thread
+        self.loading: Optional[Tuple[str, str]] = None # O que a thread está carregando agora
+        self.loaded = threading.Condition(self.lock)
+        self.requests: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
+        self.worker: Optional[threading.Thread] = None
+
+        self.loads = 0
+        self.load_time = 0.0 # Carregar + redimensionar (s), em qualquer thread
+        self.convert_time = 0.0 # Conversão para o formato do display (s)
+        self.hits = 0
+        self.sync_loads = 0 # Carregamentos feitos na hora do desenho (travadas)
+        self.prefetch_waits = 0 # Esperas pela thread de prefetch na hora do desenho
+        self.evictions = 0
+
+    # ---------- Carregamento ----------
+
+    def _find_file(self, kind: str, name: str) -> Optional[str]:
+        base = os.path.join(self.asset_dir, kind, asset_slug(name))
+        for extension in IMAGE_EXTENSIONS:
+            if os.path.exists(base + extension):
+                return base + extension
+        return None
+
+    def _load_raw(self, key: Tuple[str, str]) -> Optional[pygame.Surface]:
+        """Carrega e redimensiona (sem converter); roda na thread de prefetch ou sob demanda"""
+        kind, name = key
+        start = time.perf_counter()
+        path = self._find_file(kind, name)
+        if path is None:
+            if kind == BACKGROUND and name in self.placeholder_colors:
+                surface = pygame.Surface(self.screen_size)
+                surface.fill(self.placeholder_colors[name])
+            else:
+                surface = None
+        else:
+            surface = pygame.image.load(path)
+            if kind == BACKGROUND:
+                size = self.screen_size
+            else:
+                height = int(self.screen_size[1] * SPRITE_HEIGHT_RATIO)
+                size = (max(1, surface.get_width() * height // surface.get_height()), height)
+            if surface.get_size() != size:
+                try:
+                    surface = pygame.transform.smoothscale(surface, size)
+                except ValueError:
+                    # smoothscale só aceita 24/32 bits (ex.: PNG com paleta)
+                    surface = pygame.transform.scale(surface, size)
+        with self.lock:
+            self.loads += 1
+            self.load_time += time.perf_counter() - start
+        return surface
+
+    def _finalize(self, key: Tuple[str, str], surface: Optional[pygame.Surface]) -> Optional[pygame.Surface]:
+        """Converte para o formato do display e guarda no cache (thread principal)"""
+        if surface is None:
+            self.missing.add(key)
+            return None
+        if pygame.display.get_surface() is not None:
+            start = time.perf_counter()
+            surface = surface.convert_alpha() if key[0] == CHARACTER else surface.convert()
+            self.convert_time += time.perf_counter() - start
+        previous = self.cache.pop(key, None)
+        if previous is not None:
+            self.memory -= surface_bytes(previous)
+        self.cache[key] = surface
+        self.memory += surface_bytes(surface)
+        self._evict()
+        return surface
+
+    def _evict(self):
+        # Nunca descarta a imagem mais recente (a que acabou de ser pedida)
+        while self.memory > self.memory_limit and len(self.cache) > 1:
+            _, surface = self.cache.popitem(last=False)
+            self.memory -= surface_bytes(surface)
+            self.evictions += 1
+
+    def get(self, kind: str, name: str) -> Optional[pygame.Surface]:
+        key = (kind, name)
+        surface = self.cache.get(key)
+        if surface is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return surface
+        if key in self.missing:
+            return None
+
+        with self.lock:
+            if key == self.loading:
+                # A thread de prefetch já está carregando: espera por ela em vez de carregar de novo
+                self.prefetch_waits += 1
+                self.loaded.wait_for(lambda: key in self.pending)
+            ready = key in self.pending
+            raw = self.pending.pop(key, None)
+            if not ready:
+                # Ainda na fila: a thread vai ignorá-lo ao ver que saiu de in_flight
+                self.in_flight.discard(key)
+        if not ready:
+            # Não foi pré-carregado a tempo: carrega agora (causa uma travada)
+            self.sync_loads += 1
+            raw = self._load_raw(key)
+        return self._finalize(key, raw)
+
+    def get_background(self, name: str) -> Optional[pygame.Surface]:
+        return self.get(BACKGROUND, name)
+
+    def get_sprite(self, name: str) -> Optional[pygame.Surface]:
+        return self.get(CHARACTER, name)
+
+    # ---------- Prefetch ----------
+
+    def prefetch(self, keys: Iterable[Tuple[str, str]]):
+        """Agenda o carregamento em segundo plano de (tipo, nome) que ainda não estão no cache"""
+        for key in keys:
+            if key in self.cache:
+                # Vai ser usado em breve: não deve ser o próximo a ser descartado
+                self.cache.move_to_end(key)
+                continue
+            if key in self.missing:
+                continue
+            with self.lock:
+                if key in self.pending or key in self.in_flight:
+                    continue
+                self.in_flight.add(key)
+            self.requests.put(key)
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._worker_loop, daemon=True)
+            self.worker.start()
+
+    def _worker_loop(self):
+        while True:
+            key = self.requests.get()
+            if key is None:
+                break
+            with self.lock:
+                if key not in self.in_flight:
+                    continue # Já carregado sob demanda por get()
+                self.loading = key
+            try:
+                surface = self._load_raw(key)
+            except Exception as e:
+                print(f"Erro ao carregar asset {key[0]}/{key[1]}: {e}")
+                surface = None
+            with self.lock:
+                self.in_flight.discard(key)
+                self.loading = None
+                self.pending[key] = surface
+                self.loaded.notify_all()
+
+    def process_pending(self, max_items: int = 2):
+        """Converte e guarda no cache até `max_items` imagens já carregadas pela thread de prefetch"""
+        for _ in range(max_items):
+            with self.lock:
+                if not self.pending:
+                    return
+                key = next(iter(self.pending))
+                raw = self.pending.pop(key)
+            self._finalize(key, raw)
+
+    def stop(self):
+        if self.worker is not None:
+            self.requests.put(None)
+            self.worker = None
+
+    def get_stats(self) -> Dict[str, float]:
+        return {
+            "loads": self.loads,
+            "load_ms_avg": self.load_time * 1000 / self.loads if self.loads else 0.0,
+            "convert_ms_total": self.convert_time * 1000,
+            "hits": self.hits,
+            "sync_loads": self.sync_loads,
+            "prefetch_waits": self.prefetch_waits,
+            "evictions": self.evictions,
+            "cached": len(self.cache),
+            "memory_mb": self.memory / (1024 * 1024),
+        }
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Mede carregamento, prefetch e memória do cache de assets.")
+    parser.add_argument("--scenes", type=int, default=12)
+    parser.add_argument("--lookahead", type=int, default=3, help="Cenas pré-carregadas à frente")
+    parser.add_argument("--memory-mb", type=int, default=16)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    screen = pygame.display.set_mode((1024, 768))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, BACKGROUND))
+        names = [f"cena_{i}" for i in range(args.scenes)]
+        for i, name in enumerate(names):
+            # Arte em 1920x1080, maior que a tela, como viria de um artista
+            image = pygame.Surface((1920, 1080))
+            image.fill((i * 20 % 256, 80, 160))
+            pygame.draw.circle(image, (255, 255, 255), (960, 540), 300)
+            pygame.image.save(image, os.path.join(tmp, BACKGROUND, name + ".png"))
+
+        def play(lookahead: int):
+            """Menu e depois as cenas; em cada uma o jogador lê o diálogo por ~30 frames"""
+            assets = AssetManager(screen.get_size(), tmp, args.memory_mb * 1024 * 1024)
+            worst_ms = 0.0
+            if lookahead:
+                # Como no jogo: as primeiras cenas são pré-carregadas enquanto o menu está aberto
+                assets.prefetch((BACKGROUND, upcoming) for upcoming in names[:lookahead])
+            for frame in range(30):
+                assets.process_pending()
+                time.sleep(1 / 60)
+            for i, name in enumerate(names):
+                if lookahead:
+                    assets.prefetch((BACKGROUND, upcoming) for upcoming in names[i + 1:i + 1 + lookahead])
+                for frame in range(30):
+                    start = time.perf_counter()
+                    assets.process_pending()
+                    screen.blit(assets.get_background(name), (0, 0))
+                    worst_ms = max(worst_ms, (time.perf_counter() - start) * 1000)
+                    time.sleep(1 / 60)
+            assets.stop()
+            return worst_ms, assets.get_stats()
+
+        for label, lookahead in (("sob demanda", 0), (f"prefetch ({args.lookahead} cenas)", args.lookahead)):
+            worst_ms, stats = play(lookahead)
+            print(f"{label:>20}: pior frame {worst_ms:.1f}ms | travadas {stats['sync_loads']} | "
+                  f"carregamento médio {stats['load_ms_avg']:.1f}ms | "
+                  f"cache {stats['cached']} imagens, {stats['memory_mb']:.1f}MB "
+                  f"(limite {args.memory_mb}MB), {stats['evictions']} descartadas")
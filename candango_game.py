@@ -1,54 +1,36 @@
 import pygame
 import sys
-from typing import Dict, Optional
-import cv2
-import numpy as np
-from libras_sign_identifier import LibrasSignIdentifier, LibrasDisplay
-
-# ============== Placeholder opcional para PlatformGame ==============
-# Se você já tem platform_game.py com a classe PlatformGame, pode remover
-# esta classe e fazer "from platform_game import PlatformGame".
-class PlatformGame:
-    def __init__(self, screen=None):
-        self.screen = screen
-        self.player_x = 100
-        self.player_y = 600
-        self.player_speed = 5
-        self.player_velocity_y = 0
-        self.player_jump_power = -12
-        self.gravity = 0.6
-        self.is_jumping = False
-
-    def handle_input(self, event):
-        pass
-
-    def update(self):
-        # gravidade básica
-        self.player_velocity_y += self.gravity
-        self.player_y += self.player_velocity_y
-        if self.player_y >= 600:
-            self.player_y = 600
-            self.player_velocity_y = 0
-            self.is_jumping = False
-
-    def draw(self):
-        screen = pygame.display.get_surface()
-        screen.fill((30, 30, 40))
-        pygame.draw.rect(screen, (80, 180, 255), (0, 650, 1024, 50))
-        pygame.draw.rect(screen, (255, 220, 50), (self.player_x, int(self.player_y) - 40, 40, 40))
-        font = pygame.font.Font(None, 28)
-        info = font.render("Plataforma (ESC volta ao menu)", True, (255, 255, 255))
-        screen.blit(info, (20, 20))
-# ====================================================================
-
-# Inicializa o Pygame
-pygame.init()
-
-# Configurações da tela
+import threading
+import time
+from typing import Dict, Optional, Union, TYPE_CHECKING
+from platform_game import PlatformGame
+from candango_assets import AssetManager, BACKGROUND, CHARACTER
+from libras_telemetry import SignTelemetry, METRICS_PATH
+
+# cv2, mediapipe, pandas e sklearn são importados só na thread de
+# inicialização do Libras (_initialize_libras_identifier), para que o menu
+# apareça sem esperar por eles.
+if TYPE_CHECKING:
+    from libras_sign_identifier import LibrasSignIdentifier
+    from libras_display import LibrasDisplay
+    from libras_ipc import LibrasDaemonClient
+
+# Configurações da tela (a janela é criada em init_display)
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
-SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Candango: Neural Ascension")
+SCREEN: Optional[pygame.Surface] = None
+
+# Tempo máximo (s) entre criar o jogo e exibir o primeiro frame do menu
+FIRST_FRAME_BUDGET = 0.5
+
+# Simulação em passo fixo, independente da taxa de desenho e do reconhecimento
+FIXED_DT = 1 / 60
+MAX_FRAME_TIME = 0.25 # Limita a recuperação após um travamento longo
+MAX_RENDER_FPS = 60 # 0 = sem limite
+RECOGNITION_STOP_TIMEOUT = 5.0 # Espera (s) pelo frame em processamento ao sair
+
+# Cenas da história cujos fundos e personagens são pré-carregados à frente
+STORY_PREFETCH_SCENES = 3
 
 # Cores
 WHITE = (255, 255, 255)
@@ -58,17 +40,30 @@ GREEN = (0, 255, 0)
 RED = (255, 0, 0)
 YELLOW = (255, 255, 0)
 
-# Fontes
-try:
-    FONT_DIALOGUE = pygame.font.Font(None, 24)
-    FONT_NAME = pygame.font.Font(None, 28)
-    FONT_UI = pygame.font.Font(None, 20)
-    FONT_LARGE = pygame.font.Font(None, 64)
-except Exception:
-    FONT_DIALOGUE = pygame.font.Font(pygame.font.get_default_font(), 24)
-    FONT_NAME = pygame.font.Font(pygame.font.get_default_font(), 28)
-    FONT_UI = pygame.font.Font(pygame.font.get_default_font(), 20)
-    FONT_LARGE = pygame.font.Font(pygame.font.get_default_font(), 64)
+# Fontes (criadas em init_display)
+FONT_DIALOGUE = None
+FONT_NAME = None
+FONT_UI = None
+FONT_LARGE = None
+
+def init_display():
+    """Inicializa só os módulos do Pygame usados pelo jogo, cria a janela e as fontes"""
+    global SCREEN, FONT_DIALOGUE, FONT_NAME, FONT_UI, FONT_LARGE
+    pygame.display.init()
+    pygame.font.init()
+    SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Candango: Neural Ascension")
+
+    try:
+        FONT_DIALOGUE = pygame.font.Font(None, 24)
+        FONT_NAME = pygame.font.Font(None, 28)
+        FONT_UI = pygame.font.Font(None, 20)
+        FONT_LARGE = pygame.font.Font(None, 64)
+    except Exception:
+        FONT_DIALOGUE = pygame.font.Font(pygame.font.get_default_font(), 24)
+        FONT_NAME = pygame.font.Font(pygame.font.get_default_font(), 28)
+        FONT_UI = pygame.font.Font(pygame.font.get_default_font(), 20)
+        FONT_LARGE = pygame.font.Font(pygame.font.get_default_font(), 64)
 
 # Estados do jogo
 class GameState:
@@ -81,24 +76,38 @@ class GameState:
 class CandangoGame:
     """Classe principal do jogo Candango: Neural Ascension"""
 
-    def __init__(self):
+    def __init__(self, max_render_fps: int = MAX_RENDER_FPS, metrics_path: Optional[str] = METRICS_PATH):
+        self.startup_time = time.perf_counter()
+        self.first_frame_time: Optional[float] = None
+        if SCREEN is None:
+            init_display()
+
         self.state = GameState.MENU
         self.clock = pygame.time.Clock()
+        self.max_render_fps = max_render_fps
         self.running = True
 
-        # Libras Sign Identifier
+        # Libras Sign Identifier (carregado em segundo plano enquanto o menu é exibido)
         self.libras_enabled = True
-        self.libras_sign_identifier: Optional[LibrasSignIdentifier] = None
-        self.libras_display: Optional[LibrasDisplay] = None
+        self.libras_sign_identifier: Optional[Union["LibrasSignIdentifier", "LibrasDaemonClient"]] = None
+        self.libras_display: Optional["LibrasDisplay"] = None
         self.cap = None # Webcam capture
+        self.recognition_thread: Optional[threading.Thread] = None
+        self.libras_commands: Dict[str, object] = {}
+        self.libras_loading = False
+        self.libras_progress = 0.0
+        self.libras_stage = ""
+        self.libras_ready_time: Optional[float] = None
+        # Latência do início do sinal até a letra entrar no nome (ver libras_telemetry)
+        self.telemetry = SignTelemetry(metrics_path or None)
 
         # Visual Novel
         self.story_index = 0
         self.dialogue_text = ""
         self.dialogue_speaker = ""
         self.dialogue_typing = False
-        self.dialogue_char_index = 0
-        self.typing_speed = 2
+        self.dialogue_char_index = 0.0
+        self.typing_speed = 120 # Caracteres por segundo
 
         # Configurações
         self.gesture_sensitivity = 0.6
@@ -122,38 +131,102 @@ class CandangoGame:
         # Soletração do nome
         self.player_name = ""
         self.last_recognized_letter = ""
-        self.letter_add_timer = 0
-        self.LETTER_ADD_DELAY = 30 # Frames para adicionar a próxima letra (aprox. 0.5 segundos a 60 FPS)
+        self.letter_add_timer = 0.0
+        self.LETTER_ADD_DELAY = 0.5 # Segundos para adicionar a próxima letra
+        self.telemetry.set_config("letter_add_delay_seconds", self.LETTER_ADD_DELAY)
         self.name_spelled = False
 
         # Tela de agradecimento
         self.thank_you_message = ""
 
-        self._initialize_libras_identifier()
         self._load_assets()
+        self._start_libras_initialization()
+
+    def _start_libras_initialization(self):
+        """Dispara a inicialização do Libras numa thread para não bloquear o menu"""
+        if not self.libras_enabled:
+            return
+        self.libras_loading = True
+        threading.Thread(target=self._initialize_libras_identifier, daemon=True).start()
+
+    def _set_libras_progress(self, progress: float, stage: str):
+        self.libras_progress = progress
+        self.libras_stage = stage
 
     def _initialize_libras_identifier(self):
-        """Inicializa o identificador de sinais de Libras"""
-        if self.libras_enabled:
-            self.cap = cv2.VideoCapture(0) # Inicializa a webcam
-            if not self.cap.isOpened():
-                print("Erro: Não foi possível abrir a câmera 0. Verifique se ela está conectada e não está em uso.")
-                self.libras_enabled = False
-                return
-
-            self.libras_sign_identifier = LibrasSignIdentifier()
+        """Inicializa o identificador de sinais de Libras (executado em segundo plano)"""
+        cap = None
+        try:
+            self._set_libras_progress(0.05, "procurando daemon")
+            from libras_ipc import LibrasDaemonClient, SUB_LETTER, SUB_GESTURE, SUB_PREVIEW
+
+            # Se o daemon de Libras estiver rodando, compartilha a câmera e o modelo dele
+            identifier = LibrasDaemonClient(subscriptions=SUB_LETTER | SUB_GESTURE | SUB_PREVIEW)
+            if identifier.connect():
+                print("Conectado ao daemon de Libras.")
+            else:
+                self._set_libras_progress(0.15, "abrindo câmera")
+                import cv2
+                from libras_capture import configure_capture
+
+                cap = cv2.VideoCapture(0) # Inicializa a webcam
+                if not cap.isOpened():
+                    print("Erro: Não foi possível abrir a câmera 0. Verifique se ela está conectada e não está em uso.")
+                    self.libras_enabled = False
+                    cap.release()
+                    return
+
+                width, height, fps = configure_capture(cap)
+                print(f"Câmera configurada em {width}x{height} a {fps:.0f} FPS")
+                self.telemetry.set_config("camera_fps", fps)
+
+                self._set_libras_progress(0.35, "carregando MediaPipe e modelo")
+                from libras_sign_identifier import LibrasSignIdentifier
+                identifier = LibrasSignIdentifier(telemetry=self.telemetry)
+
+                self._set_libras_progress(0.85, "aquecendo inferência")
+                ret, frame = cap.read()
+                identifier.warm_up(frame if ret else None)
+
+            from libras_display import LibrasDisplay
             camera_size = (220, 165)
             camera_pos = (SCREEN_WIDTH - camera_size[0] - 10, 10)
-            self.libras_display = LibrasDisplay(self.libras_sign_identifier, camera_pos, camera_size)
-            print("Identificador de Libras inicializado com sucesso!")
+            self.libras_display = LibrasDisplay(identifier, camera_pos, camera_size)
+            # A captura precisa estar pronta antes de o loop principal enxergar o identificador
+            self.cap = cap
+            self.libras_sign_identifier = identifier
+            if cap is not None:
+                self.recognition_thread = threading.Thread(target=self._recognition_loop, daemon=True)
+                self.recognition_thread.start()
+            self.libras_ready_time = time.perf_counter() - self.startup_time
+            self._set_libras_progress(1.0, "pronto")
+            print(f"Identificador de Libras inicializado com sucesso! ({self.libras_ready_time:.2f}s)")
+        except Exception as e:
+            print(f"Erro ao inicializar o identificador de Libras: {e}")
+            self.libras_enabled = False
+            if cap is not None and self.cap is None:
+                cap.release()
+        finally:
+            self.libras_loading = False
 
     def _load_assets(self):
-        """Carrega assets (cores de fundo como placeholder)"""
+        """Cria o gerenciador de assets e pré-carrega as primeiras cenas enquanto o menu está aberto"""
+        # Cores usadas enquanto não existe arte em assets/backgrounds/
         self.backgrounds = {
             "office": (100, 100, 100),
             "cerrado": (34, 139, 34),
             "transition": (25, 25, 112),
         }
+        self.assets = AssetManager((SCREEN_WIDTH, SCREEN_HEIGHT), placeholder_colors=self.backgrounds)
+        self._prefetch_scenes(0)
+
+    def _prefetch_scenes(self, start: int):
+        """Agenda fundos e personagens das próximas cenas a partir de `start`"""
+        keys = []
+        for scene in self.story_script[start:start + STORY_PREFETCH_SCENES]:
+            keys.append((BACKGROUND, scene.get("background", "office")))
+            keys.append((CHARACTER, scene["speaker"]))
+        self.assets.prefetch(keys)
 
     def handle_input(self, event):
         """Entrada do usuário"""
@@ -171,6 +244,11 @@ class CandangoGame:
             elif event.key == pygame.K_c and self.libras_display:
                 self.libras_display.toggle_visibility()
 
+            elif event.key == pygame.K_BACKSPACE and self.state == GameState.SPELL_NAME and self.player_name:
+                # Letra adicionada por engano: conta como falso commit na telemetria
+                self.telemetry.false_commit(self.player_name[-1])
+                self.player_name = self.player_name[:-1]
+
             elif event.key in (pygame.K_SPACE, pygame.K_RETURN):
                 if self.state == GameState.MENU:
                     self.state = GameState.SPELL_NAME # Transição para a tela de soletração
@@ -207,34 +285,58 @@ class CandangoGame:
         if self.state == GameState.PLATFORM:
             self.platform_game.handle_input(event)
 
+    def _recognition_loop(self):
+        """Captura e processa os frames da webcam fora do loop do jogo"""
+        failures = 0
+        while self.running:
+            ret, frame = self.cap.read()
+            if not ret:
+                # Avisa uma vez por falha contínua, não a cada tentativa
+                if failures == 0:
+                    print("Erro ao capturar frame da webcam; tentando novamente...")
+                failures += 1
+                time.sleep(0.1)
+                continue
+            if failures:
+                print(f"Captura da webcam restabelecida após {failures} tentativas.")
+                failures = 0
+
+            self.libras_sign_identifier.process_frame(frame)
+
     def handle_libras_input(self):
         """Entrada por sinais de Libras"""
         if not self.libras_enabled or not self.libras_sign_identifier:
             return
 
-        # Captura o frame da webcam e processa com o identificador de Libras
-        ret, frame = self.cap.read()
-        if not ret:
-            print("Erro ao capturar frame da webcam.")
-            return
-        
-        self.libras_sign_identifier.process_frame(frame)
+        # Só lê o último resultado: a captura e o processamento rodam em
+        # _recognition_loop (ou no processo do daemon)
+        self.libras_commands = self.libras_sign_identifier.get_game_commands()
 
-        commands = self.libras_sign_identifier.get_game_commands()
-        libras_letter = commands.get("libras_letter", "")
+    def _update_spelling(self, dt: float):
+        """Lógica para soletração do nome (timer em segundos)"""
+        if self.letter_add_timer > 0:
+            self.letter_add_timer -= dt
 
-        # Lógica para soletração do nome
-        if self.state == GameState.SPELL_NAME and not self.name_spelled:
-            if libras_letter and libras_letter != "MODELO_NAO_CARREGADO" and libras_letter != "FORMATO_INCORRETO":
-                if libras_letter != self.last_recognized_letter:
-                    self.last_recognized_letter = libras_letter
-                    self.letter_add_timer = self.LETTER_ADD_DELAY # Reinicia o timer
-                elif self.letter_add_timer <= 0:
-                    self.player_name += libras_letter
-                    self.letter_add_timer = self.LETTER_ADD_DELAY # Reinicia o timer
-            
-            # A confirmação agora é feita apenas por teclado (ESPAÇO/ENTER)
-            # O gesto de 'OK' foi removido do LibrasSignIdentifier e, portanto, não é mais verificado aqui.
+        if self.name_spelled:
+            return
+
+        libras_letter = self.libras_commands.get("libras_letter", "")
+        if libras_letter and libras_letter != "MODELO_NAO_CARREGADO" and libras_letter != "FORMATO_INCORRETO":
+            marks = self.libras_commands.get("libras_marks")
+            if marks:
+                # Com o daemon, os marcos da confirmação chegam com a letra (no processo
+                # local o identificador já os registrou); repetições são ignoradas
+                self.telemetry.confirmed(libras_letter, marks=marks)
+            if libras_letter != self.last_recognized_letter:
+                self.last_recognized_letter = libras_letter
+                self.letter_add_timer = self.LETTER_ADD_DELAY # Reinicia o timer
+            elif self.letter_add_timer <= 0:
+                self.player_name += libras_letter
+                self.telemetry.committed(libras_letter)
+                self.letter_add_timer = self.LETTER_ADD_DELAY # Reinicia o timer
+
+        # A confirmação agora é feita apenas por teclado (ESPAÇO/ENTER)
+        # O gesto de 'OK' foi removido do LibrasSignIdentifier e, portanto, não é mais verificado aqui.
 
     def _start_story(self):
         self.story_index = 0
@@ -245,8 +347,9 @@ class CandangoGame:
             current = self.story_script[self.story_index]
             self.dialogue_speaker = current["speaker"]
             self.dialogue_text = current["text"]
-            self.dialogue_char_index = 0
+            self.dialogue_char_index = 0.0
             self.dialogue_typing = True
+            self._prefetch_scenes(self.story_index + 1)
 
     def _advance_dialogue(self):
         if self.dialogue_typing:
@@ -259,20 +362,19 @@ class CandangoGame:
             else:
                 self.state = GameState.PLATFORM
 
-    def update(self):
+    def update(self, dt: float = FIXED_DT):
+        """Avança a simulação em um passo fixo de `dt` segundos"""
         if self.state == GameState.VISUAL_NOVEL:
             if self.dialogue_typing:
-                self.dialogue_char_index += self.typing_speed
+                self.dialogue_char_index += self.typing_speed * dt
                 if self.dialogue_char_index >= len(self.dialogue_text):
                     self.dialogue_char_index = len(self.dialogue_text)
                     self.dialogue_typing = False
         elif self.state == GameState.PLATFORM:
-            self.platform_game.update()
+            self.platform_game.apply_commands(self.libras_commands)
+            self.platform_game.update(dt)
         elif self.state == GameState.SPELL_NAME:
-            if self.letter_add_timer > 0:
-                self.letter_add_timer -= 1
-
-        self.handle_libras_input()
+            self._update_spelling(dt)
 
     def draw_menu(self):
         SCREEN.fill(BLACK)
@@ -300,12 +402,19 @@ class CandangoGame:
             SCREEN.blit(text, text_rect)
             y_offset += 25
 
-        status_text = FONT_UI.render("✓ Libras Ativo" if self.libras_enabled else "✗ Libras Inativo", True, GREEN if self.libras_enabled else RED)
+        if self.libras_loading:
+            percent = int(self.libras_progress * 100)
+            status_text = FONT_UI.render(f"… Libras carregando: {self.libras_stage} ({percent}%)", True, YELLOW)
+            bar_rect = pygame.Rect(10, SCREEN_HEIGHT - 12, 200, 4)
+            pygame.draw.rect(SCREEN, GRAY, bar_rect)
+            pygame.draw.rect(SCREEN, YELLOW, (bar_rect.x, bar_rect.y, int(bar_rect.width * self.libras_progress), bar_rect.height))
+        else:
+            status_text = FONT_UI.render("✓ Libras Ativo" if self.libras_enabled else "✗ Libras Inativo", True, GREEN if self.libras_enabled else RED)
         SCREEN.blit(status_text, (10, SCREEN_HEIGHT - 30))
 
         # Exibir a letra de Libras reconhecida no menu
         if self.libras_enabled and self.libras_sign_identifier:
-            commands = self.libras_sign_identifier.get_game_commands()
+            commands = self.libras_commands
             libras_letter = commands.get("libras_letter", "")
             if libras_letter:
                 libras_text = FONT_UI.render(f"Libras: {libras_letter}", True, YELLOW)
@@ -321,7 +430,7 @@ class CandangoGame:
         instructions = [
             "Use os gestos de Libras para soletrar seu nome.",
             "Mantenha o gesto da letra por um momento para que ela seja adicionada.",
-            "Pressione ESPAÇO/ENTER para confirmar seu nome."
+            "BACKSPACE apaga a última letra. Pressione ESPAÇO/ENTER para confirmar seu nome."
         ]
 
         y_offset = 200
@@ -338,7 +447,7 @@ class CandangoGame:
 
         # Letra de Libras reconhecida atualmente
         if self.libras_enabled and self.libras_sign_identifier:
-            commands = self.libras_sign_identifier.get_game_commands()
+            commands = self.libras_commands
             libras_letter = commands.get("libras_letter", "")
             if libras_letter and libras_letter not in ["MODELO_NAO_CARREGADO", "FORMATO_INCORRETO"]:
                 current_letter_text = FONT_NAME.render(f"Letra atual: {libras_letter}", True, GREEN)
@@ -361,15 +470,23 @@ class CandangoGame:
 
     def draw_visual_novel(self):
         # Background
+        background = None
+        sprite = None
         if self.story_index < len(self.story_script):
-            bg_key = self.story_script[self.story_index].get("background", "office")
-            bg_color = self.backgrounds.get(bg_key, BLACK)
+            scene = self.story_script[self.story_index]
+            background = self.assets.get_background(scene.get("background", "office"))
+            sprite = self.assets.get_sprite(scene["speaker"])
+        if background is not None:
+            SCREEN.blit(background, (0, 0))
         else:
-            bg_color = BLACK
-        SCREEN.fill(bg_color)
+            SCREEN.fill(BLACK)
 
         # Área de diálogo
         dialogue_rect = pygame.Rect(50, SCREEN_HEIGHT - 200, SCREEN_WIDTH - 100, 150)
+
+        # Personagem que está falando, apoiado sobre a caixa de diálogo
+        if sprite is not None:
+            SCREEN.blit(sprite, sprite.get_rect(midbottom=(SCREEN_WIDTH * 3 // 4, dialogue_rect.top)))
         pygame.draw.rect(SCREEN, GRAY, dialogue_rect)
         pygame.draw.rect(SCREEN, WHITE, dialogue_rect, 3)
 
@@ -379,7 +496,7 @@ class CandangoGame:
             SCREEN.blit(speaker_text, (dialogue_rect.x + 20, dialogue_rect.y + 10))
 
         # Texto com "efeito digitação"
-        displayed_text = self.dialogue_text[:self.dialogue_char_index]
+        displayed_text = self.dialogue_text[:int(self.dialogue_char_index)]
         words = displayed_text.split(" ")
         lines = []
         current_line = ""
@@ -410,7 +527,7 @@ class CandangoGame:
         SCREEN.blit(FONT_UI.render(progress, True, WHITE), (10, 10))
 
         if self.libras_enabled and self.libras_sign_identifier:
-            commands = self.libras_sign_identifier.get_game_commands()
+            commands = self.libras_commands
             libras_letter = commands.get("libras_letter", "")
 
             y_offset_info = 40
@@ -419,10 +536,14 @@ class CandangoGame:
                 ltext = f"Libras: {libras_letter}"
                 SCREEN.blit(FONT_UI.render(ltext, True, YELLOW), (10, y_offset_info))
 
-    def draw_platform_game(self):
-        self.platform_game.draw()
+    def draw_platform_game(self, alpha: float = 1.0):
+        self.platform_game.draw(alpha)
+
+    def draw(self, alpha: float = 1.0):
+        """Desenha o frame; `alpha` é a fração do passo fixo já decorrida, para interpolar"""
+        # Converte para o formato do display o que o prefetch já carregou (poucas por frame)
+        self.assets.process_pending()
 
-    def draw(self):
         if self.state == GameState.MENU:
             self.draw_menu()
         elif self.state == GameState.SPELL_NAME:
@@ -430,7 +551,7 @@ class CandangoGame:
         elif self.state == GameState.VISUAL_NOVEL:
             self.draw_visual_novel()
         elif self.state == GameState.PLATFORM:
-            self.draw_platform_game()
+            self.draw_platform_game(alpha)
         elif self.state == GameState.THANK_YOU:
             self.draw_thank_you_screen()
 
@@ -439,27 +560,70 @@ class CandangoGame:
 
         pygame.display.flip()
 
+        if self.first_frame_time is None:
+            self.first_frame_time = time.perf_counter() - self.startup_time
+            if self.first_frame_time > FIRST_FRAME_BUDGET:
+                print(f"Aviso: primeiro frame levou {self.first_frame_time:.2f}s (orçamento: {FIRST_FRAME_BUDGET:.2f}s)")
+
     def run(self):
         print("Iniciando Candango: Neural Ascension...")
         print("Controles: Mouse/ESPAÇO/ENTER para avançar | ESC menu/sair | C alterna câmera")
         print("Libras: O reconhecimento de letras de Libras aparecerá na tela da câmera e no canto superior esquerdo.")
 
+        previous = time.perf_counter()
+        accumulator = 0.0
         while self.running:
+            now = time.perf_counter()
+            accumulator += min(now - previous, MAX_FRAME_TIME)
+            previous = now
+
             for event in pygame.event.get():
                 self.handle_input(event)
-            self.update()
-            self.draw()
-            self.clock.tick(60)
-
-        if self.libras_sign_identifier:
-            self.libras_sign_identifier.stop()
-        if self.cap:
-            self.cap.release()
+            self.handle_libras_input()
+
+            while accumulator >= FIXED_DT:
+                self.update(FIXED_DT)
+                accumulator -= FIXED_DT
+
+            self.draw(accumulator / FIXED_DT)
+            self.telemetry.maybe_flush()
+            self.clock.tick(self.max_render_fps)
+
+        # A thread de reconhecimento termina após o frame atual; só então o grafo
+        # do MediaPipe e a câmera podem ser fechados sem estar em uso
+        recognition_stopped = True
+        if self.recognition_thread:
+            self.recognition_thread.join(timeout=RECOGNITION_STOP_TIMEOUT)
+            recognition_stopped = not self.recognition_thread.is_alive()
+        if recognition_stopped:
+            if self.libras_sign_identifier:
+                self.libras_sign_identifier.stop()
+            if self.cap:
+                self.cap.release()
+        else:
+            print("Aviso: reconhecimento ainda em andamento; câmera e MediaPipe serão liberados ao sair do processo.")
+        self.assets.stop()
+        self.telemetry.flush()
+        if self.telemetry.path:
+            print(f"Métricas de latência gravadas em {self.telemetry.path} (relatório: python libras_telemetry.py)")
+        stats = self.assets.get_stats()
+        print(f"Assets: {stats['loads']} carregados (média {stats['load_ms_avg']:.1f}ms), "
+              f"{stats['sync_loads']} sob demanda, {stats['memory_mb']:.1f}MB em cache, "
+              f"{stats['evictions']} descartados")
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
-    game = CandangoGame()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Candango: Neural Ascension")
+    parser.add_argument("--max-fps", type=int, default=MAX_RENDER_FPS,
+                        help="Limite de FPS de desenho (0 = sem limite); valores menores sobram CPU para o reconhecimento")
+    parser.add_argument("--metrics", default=METRICS_PATH,
+                        help="Arquivo de métricas de latência no formato Prometheus (vazio = não gravar)")
+    args = parser.parse_args()
+
+    game = CandangoGame(max_render_fps=args.max_fps, metrics_path=args.metrics)
     game.run()
 
 
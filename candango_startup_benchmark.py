@@ -0,0 +1,111 @@
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, Optional
+
+# Cada medição roda num interpretador novo, para que nenhum módulo já
+# esteja em cache. Sem câmera (ou sem display, com SDL_VIDEODRIVER=dummy)
+# o tempo até o primeiro frame continua válido: o carregamento do Libras
+# apenas termina como "Libras Inativo".
+
+MODULES = [
+    "pygame",
+    "numpy",
+    "cv2",
+    "mediapipe",
+    "pandas",
+    "sklearn",
+    "libras_model_loader",
+    "libras_sign_identifier",
+    "candango_game",
+]
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+FIRST_FRAME_SNIPPET = """
+import json, os, time
+start = time.perf_counter()
+import candango_game
+imported = time.perf_counter() - start
+game = candango_game.CandangoGame()
+game.draw()
+first_frame = time.perf_counter() - start
+deadline = start + {timeout}
+while game.libras_loading and time.perf_counter() < deadline:
+    candango_game.pygame.event.pump()
+    game.draw()
+    game.clock.tick(60)
+ready = time.perf_counter() - start if not game.libras_loading else None
+print(json.dumps({{
+    "import_s": imported,
+    "first_frame_s": first_frame,
+    "first_frame_in_game_s": game.first_frame_time,
+    "libras_ready_s": ready,
+    "libras_enabled": game.libras_enabled,
+}}))
+os._exit(0)
+"""
+
+def _run(snippet: str, env: Optional[Dict[str, str]] = None) -> Optional[str]:
+    here = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([sys.executable, "-c", snippet], cwd=here, env=env,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip().splitlines()[-1]
+
+def measure_import_times(repeats: int = 3) -> Dict[str, Optional[float]]:
+    """Melhor tempo de importação (s) de cada módulo num interpretador limpo."""
+    times = {}
+    for module in MODULES:
+        samples = []
+        for _ in range(repeats):
+            output = _run(IMPORT_SNIPPET.format(module=module))
+            if output is not None:
+                samples.append(float(output))
+        times[module] = min(samples) if samples else None
+    return times
+
+def measure_first_frame(timeout: float = 30.0, headless: bool = False) -> Optional[Dict[str, float]]:
+    """Tempo até o primeiro frame do menu e até o Libras ficar pronto."""
+    env = dict(os.environ)
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    if headless:
+        env["SDL_VIDEODRIVER"] = "dummy"
+    output = _run(FIRST_FRAME_SNIPPET.format(timeout=timeout), env)
+    return json.loads(output) if output else None
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mede o tempo de importação e o tempo até o primeiro frame do jogo.")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--headless", action="store_true", help="Usar SDL_VIDEODRIVER=dummy (sem janela)")
+    args = parser.parse_args()
+
+    print("Tempo de importação (interpretador limpo):")
+    for module, seconds in measure_import_times(args.repeats).items():
+        value = f"{seconds * 1000:8.1f}ms" if seconds is not None else "   indisponível"
+        print(f"  {module:>24}: {value}")
+
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    from candango_game import FIRST_FRAME_BUDGET
+    result = measure_first_frame(headless=args.headless)
+    if result is None:
+        print("Falha ao medir o tempo até o primeiro frame.")
+        sys.exit(1)
+    status = "OK" if result["first_frame_s"] <= FIRST_FRAME_BUDGET else "ACIMA DO ORÇAMENTO"
+    print(f"\nImportação de candango_game: {result['import_s'] * 1000:.1f}ms")
+    print(f"Primeiro frame do menu: {result['first_frame_s'] * 1000:.1f}ms "
+          f"(orçamento {FIRST_FRAME_BUDGET * 1000:.0f}ms: {status})")
+    if result["libras_ready_s"] is not None:
+        state = "ativo" if result["libras_enabled"] else "inativo"
+        print(f"Libras pronto ({state}): {result['libras_ready_s'] * 1000:.1f}ms")
+    else:
+        print("Libras ainda carregando ao fim do tempo limite.")
@@ -0,0 +1,227 @@
+import time
+from typing import Optional, Tuple, Dict
+import cv2
+import numpy as np
+
+# ============== Pré-processamento da captura ==============
+# O MediaPipe normaliza os landmarks pelo tamanho da imagem recebida, então
+# detectar num frame reduzido ou num recorte em volta da mão e depois
+# remapear as coordenadas para o frame inteiro entrega ao classificador as
+# mesmas features do pipeline original, com muito menos pixels convertidos.
+
+# O MediaPipe normaliza x pela largura e y pela altura, então a proporção da
+# imagem muda a forma dos landmarks. O libras_dataset.csv foi gravado no modo
+# padrão das webcams (640x480, 4:3); outra proporção distorce as features.
+CAPTURE_SIZE = (640, 480)
+CAPTURE_FPS = 30
+
+def configure_capture(cap, size: Tuple[int, int] = CAPTURE_SIZE, fps: int = CAPTURE_FPS) -> Tuple[int, int, float]:
+    """Negocia resolução e FPS com a câmera e retorna os valores aceitos por ela.
+
+    Avisa se a câmera não aceitar a proporção de `size` (a do dataset).
+    """
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, size[0])
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, size[1])
+    cap.set(cv2.CAP_PROP_FPS, fps)
+    # Evita acumular frames antigos no buffer do driver
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    actual_fps = cap.get(cv2.CAP_PROP_FPS)
+    if width and height and abs(width / height - size[0] / size[1]) > 0.01:
+        print(f"Aviso: a câmera usa {width}x{height}, proporção diferente de {size[0]}x{size[1]} "
+              f"(a do dataset); o reconhecimento das letras pode piorar.")
+    return width, height, actual_fps
+
+class HandRoiTracker:
+    """Detecta a mão num frame reduzido e depois a acompanha num recorte ampliado.
+
+    Recebe o frame BGR original (sem espelhar) e devolve os resultados do
+    MediaPipe com os landmarks em coordenadas normalizadas do frame inteiro
+    espelhado, junto com uma pré-visualização reduzida e espelhada onde os
+    landmarks podem ser desenhados. Quando a mão some do recorte, volta à
+    detecção no frame inteiro.
+
+    O rastreamento interno do MediaPipe (static_image_mode=False) usa os
+    landmarks do frame anterior nas coordenadas da imagem anterior, então
+    frame inteiro e recorte precisam de instâncias separadas: `hands` só
+    recebe o frame reduzido e `roi_hands` só recebe recortes. Sem
+    `roi_hands`, apenas a detecção reduzida é usada.
+    """
+
+    def __init__(self, hands, roi_hands=None, detection_width: int = 480, roi_size: int = 256, padding: float = 0.35,
+                 min_roi: int = 96):
+        self.hands = hands
+        self.roi_hands = roi_hands
+        self.detection_width = detection_width
+        self.roi_size = roi_size
+        self.padding = padding
+        self.min_roi = min_roi
+        self.bbox: Optional[Tuple[float, float, float, float]] = None # x0, y0, x1, y1 em pixels (espelhado)
+
+        self.frames = 0
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.lost = 0
+
+    def reset(self):
+        self.bbox = None
+
+    def prepare_preview(self, frame: np.ndarray) -> np.ndarray:
+        """Reduz e espelha o frame inteiro (BGR) para detecção e pré-visualização."""
+        height, width = frame.shape[:2]
+        if width > self.detection_width:
+            scale = self.detection_width / width
+            frame = cv2.resize(frame, (self.detection_width, int(height * scale)), interpolation=cv2.INTER_LINEAR)
+        return cv2.flip(frame, 1)
+
+    def roi_window(self, width: int, height: int) -> Tuple[int, int, int, int]:
+        """Recorte quadrado com margem em volta da última mão, limitado ao frame."""
+        x0, y0, x1, y1 = self.bbox
+        side = max(x1 - x0, y1 - y0) * (1 + 2 * self.padding)
+        side = max(side, self.min_roi)
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        rx0 = int(max(0, cx - side / 2))
+        ry0 = int(max(0, cy - side / 2))
+        rx1 = int(min(width, cx + side / 2))
+        ry1 = int(min(height, cy + side / 2))
+        return rx0, ry0, rx1, ry1
+
+    def prepare_roi(self, frame: np.ndarray, window: Tuple[int, int, int, int]) -> np.ndarray:
+        """Recorta a janela (em coordenadas espelhadas) do frame original e devolve em RGB."""
+        width = frame.shape[1]
+        rx0, ry0, rx1, ry1 = window
+        # Recorta no frame original e espelha só o recorte
+        crop = cv2.flip(frame[ry0:ry1, width - rx1:width - rx0], 1)
+        crop_w, crop_h = rx1 - rx0, ry1 - ry0
+        scale = self.roi_size / max(crop_w, crop_h)
+        if scale < 1:
+            crop = cv2.resize(crop, (max(1, int(crop_w * scale)), max(1, int(crop_h * scale))), interpolation=cv2.INTER_LINEAR)
+        return cv2.cvtColor(crop, cv2.COLOR_BGR2RGB)
+
+    def _map_from_roi(self, results, window: Tuple[int, int, int, int], width: int, height: int):
+        rx0, ry0, rx1, ry1 = window
+        crop_w, crop_h = rx1 - rx0, ry1 - ry0
+        for hand_landmarks in results.multi_hand_landmarks:
+            for landmark in hand_landmarks.landmark:
+                landmark.x = (rx0 + landmark.x * crop_w) / width
+                landmark.y = (ry0 + landmark.y * crop_h) / height
+                # z usa a mesma escala de x
+                landmark.z = landmark.z * crop_w / width
+
+    def _update_bbox(self, results, width: int, height: int):
+        if not results.multi_hand_landmarks:
+            self.bbox = None
+            return
+        points = np.array([(lm.x, lm.y) for lm in results.multi_hand_landmarks[0].landmark])
+        x0, y0 = points.min(axis=0)
+        x1, y1 = points.max(axis=0)
+        self.bbox = (x0 * width, y0 * height, x1 * width, y1 * height)
+
+    def process(self, frame: np.ndarray):
+        """Retorna (resultados do MediaPipe, pré-visualização BGR reduzida e espelhada)."""
+        self.frames += 1
+        height, width = frame.shape[:2]
+        preview = self.prepare_preview(frame)
+
+        window = self.roi_window(width, height) if self.bbox is not None and self.roi_hands is not None else None
+        if window is not None and window[2] - window[0] > 1 and window[3] - window[1] > 1:
+            results = self.roi_hands.process(self.prepare_roi(frame, window))
+            if results.multi_hand_landmarks:
+                self.roi_frames += 1
+                self._map_from_roi(results, window, width, height)
+                self._update_bbox(results, width, height)
+                return results, preview
+            self.lost += 1
+
+        # Sem mão rastreada: detecção no frame inteiro reduzido. A escala é
+        # uniforme, então as coordenadas normalizadas já valem para o frame original.
+        self.full_frames += 1
+        results = self.hands.process(cv2.cvtColor(preview, cv2.COLOR_BGR2RGB))
+        self._update_bbox(results, width, height)
+        return results, preview
+
+    def get_stats(self) -> Dict[str, float]:
+        return {
+            "frames": self.frames,
+            "roi_frames": self.roi_frames,
+            "full_frames": self.full_frames,
+            "lost": self.lost,
+            "roi_ratio": self.roi_frames / self.frames if self.frames else 0.0,
+        }
+
+# ============== Benchmark de custo por frame ==============
+
+RESOLUTIONS = {
+    "480p": (640, 480),
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+}
+
+def _time_ms(fn, repeats: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) * 1000.0 / repeats
+
+def benchmark_preprocessing(repeats: int = 200, hands=None, roi_hands=None) -> Dict[str, Dict[str, float]]:
+    """Custo médio por frame (ms) do pipeline original, da detecção reduzida e do recorte.
+
+    Sem `hands`, mede apenas o pré-processamento (espelhar, converter,
+    reduzir e recortar) sobre frames sintéticos; com instâncias do
+    MediaPipe Hands, inclui também a chamada a `process` (`roi_hands` no
+    recorte, como no HandRoiTracker).
+    """
+    process = hands.process if hands is not None else (lambda image: None)
+    roi_process = roi_hands.process if roi_hands is not None else process
+    report = {}
+    rng = np.random.default_rng(0)
+    for name, (width, height) in RESOLUTIONS.items():
+        frame = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        tracker = HandRoiTracker(hands, roi_hands)
+        # Mão típica ocupando ~1/4 da altura, no centro do frame
+        hand = height / 4
+        tracker.bbox = (width / 2 - hand / 2, height / 2 - hand / 2, width / 2 + hand / 2, height / 2 + hand / 2)
+        window = tracker.roi_window(width, height)
+
+        def baseline():
+            flipped = cv2.flip(frame, 1)
+            process(cv2.cvtColor(flipped, cv2.COLOR_BGR2RGB))
+
+        def detection():
+            process(cv2.cvtColor(tracker.prepare_preview(frame), cv2.COLOR_BGR2RGB))
+
+        def roi():
+            tracker.prepare_preview(frame)
+            roi_process(tracker.prepare_roi(frame, window))
+
+        base_ms = _time_ms(baseline, repeats)
+        detection_ms = _time_ms(detection, repeats)
+        roi_ms = _time_ms(roi, repeats)
+        report[name] = {
+            "baseline_ms": base_ms,
+            "detection_ms": detection_ms,
+            "roi_ms": roi_ms,
+            "roi_saving": 1 - roi_ms / base_ms if base_ms else 0.0,
+        }
+    return report
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mede o custo por frame do pré-processamento da captura.")
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--mediapipe", action="store_true", help="Incluir a inferência do MediaPipe Hands na medição")
+    args = parser.parse_args()
+
+    hands = roi_hands = None
+    if args.mediapipe:
+        import mediapipe as mp
+        hands, roi_hands = (mp.solutions.hands.Hands(static_image_mode=False, max_num_hands=1,
+                                                     min_detection_confidence=0.7, min_tracking_confidence=0.5)
+                            for _ in range(2))
+
+    for name, values in benchmark_preprocessing(args.repeats, hands, roi_hands).items():
+        print(f"{name:>6}: original {values['baseline_ms']:.2f}ms | detecção reduzida {values['detection_ms']:.2f}ms | "
+              f"recorte {values['roi_ms']:.2f}ms | economia {values['roi_saving'] * 100:.0f}%")
@@ -0,0 +1,260 @@
+import os
+import socket
+import threading
+import queue
+import time
+from typing import Optional, List
+import cv2
+from libras_sign_identifier import LibrasSignIdentifier
+from libras_capture import configure_capture
+from libras_telemetry import SignTelemetry
+from libras_ipc import (
+    SOCKET_PATH, TIMESTAMP, MSG_SUBSCRIBE, MSG_PING, MSG_PONG,
+    SUB_LANDMARKS, SUB_LETTER, SUB_GESTURE, SUB_PREVIEW,
+    encode_message, recv_message, encode_landmarks, encode_letter,
+    encode_gesture, encode_preview,
+)
+
+CAPTURE_STOP_TIMEOUT = 5.0 # Espera (s) pelo frame em processamento ao encerrar
+
+class _DaemonConnection:
+    """Conexão de um cliente: uma thread lê pedidos e outra envia as publicações.
+
+    A fila de envio é limitada; se o cliente ficar lento, as mensagens mais
+    antigas são descartadas para não atrasar a captura nem os demais clientes.
+    """
+
+    def __init__(self, conn: socket.socket, max_pending: int = 32):
+        self.conn = conn
+        self.subscriptions = 0
+        self.alive = True
+        self.outbox = queue.Queue(maxsize=max_pending)
+        self.dropped = 0
+        threading.Thread(target=self._reader_loop, daemon=True).start()
+        threading.Thread(target=self._sender_loop, daemon=True).start()
+
+    def publish(self, data: bytes):
+        while self.alive:
+            try:
+                self.outbox.put_nowait(data)
+                return
+            except queue.Full:
+                try:
+                    self.outbox.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def _reader_loop(self):
+        try:
+            while self.alive:
+                message = recv_message(self.conn)
+                if message is None:
+                    break
+                msg_type, payload = message
+                if msg_type == MSG_SUBSCRIBE and payload:
+                    self.subscriptions = payload[0]
+                elif msg_type == MSG_PING:
+                    self.publish(encode_message(MSG_PONG, payload[:TIMESTAMP.size]))
+        except (OSError, ValueError):
+            pass
+        self.close()
+
+    def _sender_loop(self):
+        try:
+            while self.alive:
+                data = self.outbox.get()
+                if data is None:
+                    break
+                self.conn.sendall(data)
+        except OSError:
+            pass
+        self.close()
+
+    def close(self):
+        if not self.alive:
+            return
+        self.alive = False
+        try:
+            self.outbox.put_nowait(None)
+        except queue.Full:
+            pass
+        try:
+            self.conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.conn.close()
+
+class LibrasDaemon:
+    """Serviço local que mantém uma única câmera e um único pipeline de reconhecimento.
+
+    O jogo, o coletor e os benchmarks se conectam pelo socket Unix
+    (ver libras_ipc.LibrasDaemonClient) em vez de abrir a câmera e criar
+    a própria instância do MediaPipe.
+    """
+
+    def __init__(self, socket_path: str = SOCKET_PATH, camera_index: int = 0,
+                 identifier: Optional[LibrasSignIdentifier] = None, preview_size=(320, 240), preview_quality: int = 70,
+                 metrics_path: Optional[str] = None):
+        self.socket_path = socket_path
+        self.camera_index = camera_index
+        self.identifier = identifier
+        self.preview_size = preview_size
+        self.preview_quality = preview_quality
+        # Frames e confirmações medidos no daemon; os marcos de cada confirmação vão
+        # com a letra e o jogo, que faz o commit, registra as latências por etapa
+        self.telemetry = SignTelemetry(metrics_path, commits=False)
+        self.cap = None
+        self.server: Optional[socket.socket] = None
+        self.connections: List[_DaemonConnection] = []
+        self.connections_lock = threading.Lock()
+        self.running = False
+        self.capture_thread: Optional[threading.Thread] = None
+        self.frames_processed = 0
+
+    def _claim_socket_path(self) -> bool:
+        if not os.path.exists(self.socket_path):
+            return True
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+            print(f"Erro: já existe um daemon de Libras ativo em {self.socket_path}.")
+            return False
+        except OSError:
+            # Socket órfão de uma execução anterior
+            os.unlink(self.socket_path)
+            return True
+        finally:
+            probe.close()
+
+    def start(self) -> bool:
+        if not self._claim_socket_path():
+            return False
+
+        self.cap = cv2.VideoCapture(self.camera_index)
+        if not self.cap.isOpened():
+            print(f"Erro: Não foi possível abrir a câmera {self.camera_index}. Verifique se ela está conectada e não está em uso.")
+            return False
+        width, height, fps = configure_capture(self.cap)
+        print(f"Câmera configurada em {width}x{height} a {fps:.0f} FPS")
+
+        if self.identifier is None:
+            self.identifier = LibrasSignIdentifier(telemetry=self.telemetry)
+        self.identifier.telemetry.set_config("camera_fps", fps)
+        self.identifier.running = True
+
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(self.socket_path)
+        self.server.listen()
+        self.running = True
+
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.capture_thread.start()
+        print(f"Daemon de Libras escutando em {self.socket_path}")
+        return True
+
+    def _accept_loop(self):
+        while self.running:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                break
+            with self.connections_lock:
+                self.connections.append(_DaemonConnection(conn))
+
+    def _capture_loop(self):
+        while self.running:
+            ret, frame = self.cap.read()
+            if not ret:
+                time.sleep(0.01)
+                continue
+            self.identifier.process_frame(frame)
+            self.frames_processed += 1
+            self._broadcast()
+
+    def _broadcast(self):
+        with self.connections_lock:
+            self.connections = [c for c in self.connections if c.alive]
+            connections = list(self.connections)
+        if not connections:
+            return
+
+        wanted = 0
+        for connection in connections:
+            wanted |= connection.subscriptions
+
+        # Cada mensagem é codificada uma única vez por frame e compartilhada
+        timestamp = time.monotonic()
+        messages = {}
+        if wanted & SUB_LANDMARKS:
+            messages[SUB_LANDMARKS] = encode_landmarks(timestamp, self.identifier.current_landmarks)
+        if wanted & SUB_LETTER:
+            letter = self.identifier.current_libras_letter
+            marks = self.identifier.telemetry.confirmation_marks(letter) if letter else None
+            messages[SUB_LETTER] = encode_letter(timestamp, letter, marks)
+        if wanted & SUB_GESTURE:
+            gesture, confidence = self.identifier.get_gesture_info()
+            commands = self.identifier.get_game_commands()
+            messages[SUB_GESTURE] = encode_gesture(timestamp, gesture, confidence, commands)
+        if wanted & SUB_PREVIEW:
+            frame = self.identifier.get_current_frame()
+            if frame is not None:
+                preview = encode_preview(timestamp, cv2.resize(frame, self.preview_size), self.preview_quality)
+                if preview is not None:
+                    messages[SUB_PREVIEW] = preview
+
+        for connection in connections:
+            for flag, data in messages.items():
+                if connection.subscriptions & flag:
+                    connection.publish(data)
+
+    def serve_forever(self):
+        try:
+            while self.running:
+                time.sleep(0.5)
+                self.identifier.telemetry.maybe_flush()
+        except KeyboardInterrupt:
+            pass
+        self.stop()
+
+    def stop(self):
+        self.running = False
+        if self.server:
+            self.server.close()
+            self.server = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        with self.connections_lock:
+            for connection in self.connections:
+                connection.close()
+            self.connections = []
+        # O MediaPipe e a câmera só são liberados depois que a captura sai de read()/process_frame
+        capture_stopped = True
+        if self.capture_thread:
+            self.capture_thread.join(timeout=CAPTURE_STOP_TIMEOUT)
+            capture_stopped = not self.capture_thread.is_alive()
+            self.capture_thread = None
+        if not capture_stopped:
+            print("Aviso: captura ainda em andamento; câmera e MediaPipe serão liberados ao sair do processo.")
+        if self.identifier:
+            if capture_stopped:
+                self.identifier.stop()
+            self.identifier.telemetry.flush()
+        if self.cap and capture_stopped:
+            self.cap.release()
+            self.cap = None
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Daemon local de reconhecimento de Libras.")
+    parser.add_argument("--socket", default=SOCKET_PATH)
+    parser.add_argument("--camera", type=int, default=0)
+    parser.add_argument("--metrics", default=None, help="Arquivo de métricas de latência no formato Prometheus")
+    args = parser.parse_args()
+
+    daemon = LibrasDaemon(args.socket, args.camera, metrics_path=args.metrics)
+    if daemon.start():
+        print("Pressione Ctrl+C para encerrar.")
+        daemon.serve_forever()
@@ -3,9 +3,11 @@ import mediapipe as mp
 import numpy as np
 import csv
 import os
+from libras_ipc import LibrasDaemonClient, SUB_LANDMARKS, SUB_PREVIEW
+from libras_capture import configure_capture, HandRoiTracker
+from libras_features import extract_landmarks, get_handedness
 
 mp_hands = mp.solutions.hands
-hands = mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.7)
 mp_draw = mp.solutions.drawing_utils
 
 # Nome do arquivo CSV para salvar os dados
@@ -22,13 +24,46 @@ if not os.path.exists(DATASET_FILE):
         writer = csv.writer(f)
         writer.writerow(HEADER)
 
-def extract_features(hand_landmarks):
-    landmarks = []
-    for lm in hand_landmarks.landmark:
-        landmarks.extend([lm.x, lm.y, lm.z])
-    return landmarks
+# Se o daemon de Libras estiver rodando, usa os landmarks e a pré-visualização dele
+# em vez de abrir a câmera (assim o jogo e o coletor podem rodar juntos)
+client = LibrasDaemonClient(subscriptions=SUB_LANDMARKS | SUB_PREVIEW)
+if client.connect():
+    print("Conectado ao daemon de Libras.")
+    cap = None
+    hands = None
+else:
+    client = None
+    cap = cv2.VideoCapture(0)
+    configure_capture(cap)
+    hands = mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.7)
+    roi_hands = mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.7)
+    tracker = HandRoiTracker(hands, roi_hands)
+
+def read_landmarks():
+    """Retorna (imagem, lista de features ou None); imagem None encerra a coleta."""
+    if client is not None:
+        img = None
+        while img is None:
+            if not client.wait_for_update():
+                return None, None
+            img = client.get_current_frame()
+        _, features = client.get_landmarks()
+        return img, features
 
-cap = cv2.VideoCapture(0)
+    success, img = cap.read()
+    if not success:
+        return None, None
+
+    # Detecção reduzida/recortada; img volta espelhada para uma visualização mais intuitiva
+    results, img = tracker.process(img)
+
+    features = None
+    if results.multi_hand_landmarks:
+        for i, hand_landmarks in enumerate(results.multi_hand_landmarks):
+            mp_draw.draw_landmarks(img, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+            # Salva sempre na mão canônica (mãos esquerdas são espelhadas)
+            features = extract_landmarks(hand_landmarks, get_handedness(results, i))
+    return img, features
 
 print("\nModo de Coleta de Dados de Libras ativado.")
 print("Pressione uma tecla (a-z) para a letra correspondente e ENTER para salvar a pose.")
@@ -37,42 +72,33 @@ print("Pressione 'q' para sair.\n")
 current_label = ''
 
 while True:
-    success, img = cap.read()
-    if not success:
+    img, features = read_landmarks()
+    if img is None:
         break
 
-    img = cv2.flip(img, 1) # Espelhar a imagem para uma visualização mais intuitiva
-    img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-    results = hands.process(img_rgb)
+    if features:
+        # Exibir a label atual para coleta
+        cv2.putText(img, f'Coletando: {current_label}', (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2, cv2.LINE_AA)
+        cv2.putText(img, 'Pressione uma tecla (a-z) e ENTER para salvar', (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 1, cv2.LINE_AA)
+        cv2.putText(img, 'Pressione Q para sair', (10, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 1, cv2.LINE_AA)
 
-    if results.multi_hand_landmarks:
-        for hand_landmarks in results.multi_hand_landmarks:
-            mp_draw.draw_landmarks(img, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+        key = cv2.waitKey(1) & 0xFF
 
-            features = extract_features(hand_landmarks)
-            
-            # Exibir a label atual para coleta
-            cv2.putText(img, f'Coletando: {current_label}', (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2, cv2.LINE_AA)
-            cv2.putText(img, 'Pressione uma tecla (a-z) e ENTER para salvar', (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 1, cv2.LINE_AA)
-            cv2.putText(img, 'Pressione Q para sair', (10, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 1, cv2.LINE_AA)
-
-            key = cv2.waitKey(1) & 0xFF
-
-            if key >= ord('a') and key <= ord('z'):
-                current_label = chr(key).upper()
-                print(f"Pronto para coletar para a letra: {current_label}")
-            elif key == 13: # Tecla ENTER
-                if current_label and features:
-                    row = [current_label] + features
-                    with open(DATASET_FILE, 'a', newline='') as f:
-                        writer = csv.writer(f)
-                        writer.writerow(row)
-                    print(f"Dados para a letra {current_label} salvos com sucesso!")
-                    current_label = '' # Limpar a label após salvar
-                else:
-                    print("Nenhuma label definida ou landmarks não detectadas. Tente novamente.")
-            elif key == ord('q'):
-                break
+        if key >= ord('a') and key <= ord('z'):
+            current_label = chr(key).upper()
+            print(f"Pronto para coletar para a letra: {current_label}")
+        elif key == 13: # Tecla ENTER
+            if current_label and features:
+                row = [current_label] + features
+                with open(DATASET_FILE, 'a', newline='') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(row)
+                print(f"Dados para a letra {current_label} salvos com sucesso!")
+                current_label = '' # Limpar a label após salvar
+            else:
+                print("Nenhuma label definida ou landmarks não detectadas. Tente novamente.")
+        elif key == ord('q'):
+            break
     else:
         cv2.putText(img, 'Nenhuma mao detectada', (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2, cv2.LINE_AA)
         cv2.putText(img, 'Pressione Q para sair', (10, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 1, cv2.LINE_AA)
@@ -85,7 +111,10 @@ while True:
     if cv2.waitKey(1) & 0xFF == ord('q'):
         break
 
-cap.release()
+if client is not None:
+    client.stop()
+else:
+    cap.release()
 cv2.destroyAllWindows()
 
 
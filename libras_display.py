@@ -0,0 +1,56 @@
+from typing import Tuple, Union, TYPE_CHECKING
+import cv2
+import pygame
+
+# Só pygame e cv2: o jogo usa este widget também quando está ligado ao
+# daemon, sem carregar MediaPipe, sklearn e pandas.
+if TYPE_CHECKING:
+    from libras_sign_identifier import LibrasSignIdentifier
+    from libras_ipc import LibrasDaemonClient
+
+class LibrasDisplay:
+    def __init__(self, controller: Union["LibrasSignIdentifier", "LibrasDaemonClient"], position: Tuple[int, int], size: Tuple[int, int]):
+        self.controller = controller
+        self.position = position
+        self.size = size
+        self.visible = True
+        
+    def toggle_visibility(self):
+        self.visible = not self.visible
+    
+    def draw(self, surface: pygame.Surface):
+        if not self.visible:
+            return
+        
+        frame = self.controller.get_current_frame()
+        if frame is None:
+            return
+        
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        frame_resized = cv2.resize(frame_rgb, self.size)
+        frame_surface = pygame.surfarray.make_surface(frame_resized.swapaxes(0, 1))
+        
+        surface.blit(frame_surface, self.position)
+        
+        gesture, confidence = self.controller.get_gesture_info()
+        libras_letter = self.controller.current_libras_letter
+
+        font = pygame.font.Font(None, 24)
+        y_offset = self.position[1] + self.size[1] + 5
+
+        if gesture != "none":
+            text = f"Gesto: {gesture} ({confidence:.2f})"
+            text_surface = font.render(text, True, (255, 255, 255))
+            text_rect = text_surface.get_rect()
+            text_rect.topleft = (self.position[0], y_offset)
+            pygame.draw.rect(surface, (0, 0, 0), text_rect.inflate(10, 5))
+            surface.blit(text_surface, text_rect)
+            y_offset += text_rect.height + 5
+            
+        if libras_letter:
+            text = f"Libras: {libras_letter}"
+            text_surface = font.render(text, True, (255, 255, 0))
+            text_rect = text_surface.get_rect()
+            text_rect.topleft = (self.position[0], y_offset)
+            pygame.draw.rect(surface, (0, 0, 0), text_rect.inflate(10, 5))
+            surface.blit(text_surface, text_rect)
@@ -0,0 +1,181 @@
+from typing import Optional, List, Dict
+import numpy as np
+
+# ============== Pipeline de features dos landmarks ==============
+# Usado pelo coletor, pelo LibrasModelLoader e pelo LibrasSignIdentifier.
+#
+# O CSV continua guardando as coordenadas cruas do MediaPipe (normalizadas
+# pela imagem), só que sempre na mão canônica (direita): mãos esquerdas são
+# espelhadas na extração. Na hora de treinar e de classificar, as features
+# passam a ser relativas ao pulso e divididas pelo tamanho da palma, então
+# não dependem de onde a mão está no frame nem da distância até a câmera.
+
+NUM_LANDMARKS = 21
+WRIST = 0
+MIDDLE_MCP = 9
+
+# Mão de referência do dataset (rótulo do MediaPipe sobre a imagem espelhada)
+CANONICAL_HANDEDNESS = "Right"
+
+def extract_landmarks(hand_landmarks, handedness: Optional[str] = None) -> List[float]:
+    """Achata os 21 landmarks do MediaPipe em [x0, y0, z0, ...], espelhando mãos não canônicas."""
+    landmarks_flat = []
+    for landmark in hand_landmarks.landmark:
+        landmarks_flat.extend([landmark.x, landmark.y, landmark.z])
+    if handedness is not None and handedness != CANONICAL_HANDEDNESS:
+        landmarks_flat = mirror_landmarks(landmarks_flat).tolist()
+    return landmarks_flat
+
+def get_handedness(results, index: int) -> Optional[str]:
+    """Rótulo "Left"/"Right" da mão `index` nos resultados do MediaPipe, se disponível."""
+    if not getattr(results, "multi_handedness", None) or index >= len(results.multi_handedness):
+        return None
+    return results.multi_handedness[index].classification[0].label
+
+def mirror_landmarks(landmarks) -> np.ndarray:
+    """Espelha horizontalmente landmarks crus (x -> 1 - x). Aceita (63,) ou (N, 63)."""
+    mirrored = np.array(landmarks, dtype=np.float64)
+    mirrored[..., 0::3] = 1.0 - mirrored[..., 0::3]
+    return mirrored
+
+def normalize_landmarks(landmarks, mirror: bool = False) -> np.ndarray:
+    """Features relativas ao pulso e normalizadas pelo tamanho da palma.
+
+    Aceita um vetor (63,) ou um lote (N, 63) e devolve o mesmo formato. O
+    tamanho da palma é a distância 3D entre o pulso e a base do dedo médio.
+    Com `mirror`, o eixo x é invertido (mão esquerda <-> direita).
+    """
+    data = np.asarray(landmarks, dtype=np.float64)
+    points = data.reshape(-1, NUM_LANDMARKS, 3)
+    points = points - points[:, WRIST:WRIST + 1, :]
+    palm = np.linalg.norm(points[:, MIDDLE_MCP, :], axis=1)
+    palm[palm < 1e-6] = 1.0
+    points = points / palm[:, None, None]
+    if mirror:
+        points[..., 0] = -points[..., 0]
+    return points.reshape(data.shape)
+
+# ============== Avaliação em amostras fora do treino: frames até confirmar e tamanho do índice ==============
+
+def frames_to_confirm(predictions: List[str], target: str, threshold: int) -> Optional[int]:
+    """Frames até `threshold` previsões seguidas iguais a `target` (mesma regra de update_libras_stability)."""
+    streak = 0
+    for i, prediction in enumerate(predictions):
+        streak = streak + 1 if prediction == target else 0
+        if streak >= threshold:
+            return i + 1
+    return None
+
+def simulate_held_sign(landmarks: np.ndarray, frames: int, rng: np.random.Generator,
+                       drift: float = 0.004, zoom: float = 0.004, jitter: float = 0.002) -> np.ndarray:
+    """Gera um lote (frames, 63) de uma pose segurada enquanto a mão se desloca e se aproxima/afasta."""
+    points = landmarks.reshape(NUM_LANDMARKS, 3)
+    center = points[:, :2].mean(axis=0)
+    offsets = np.cumsum(rng.normal(0, drift, (frames, 2)), axis=0)
+    scales = np.exp(np.cumsum(rng.normal(0, zoom, frames)))
+    batch = np.repeat(points[None], frames, axis=0)
+    batch[:, :, :2] = (batch[:, :, :2] - center) * scales[:, None, None] + center + offsets[:, None, :]
+    batch[:, :, 2] *= scales[:, None]
+    batch[:, :, :2] += rng.normal(0, jitter, (frames, NUM_LANDMARKS, 2))
+    return batch.reshape(frames, -1)
+
+def placed_elsewhere(landmarks: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """A mesma pose em outra posição do frame e a outra distância da câmera."""
+    points = landmarks.reshape(NUM_LANDMARKS, 3).copy()
+    center = points[:, :2].mean(axis=0)
+    scale = rng.uniform(0.6, 1.4)
+    target = rng.uniform(0.25, 0.75, 2)
+    points[:, :2] = (points[:, :2] - center) * scale + target
+    points[:, 2] *= scale
+    return points.reshape(-1)
+
+def holdout_folds(y: np.ndarray, folds: int = 3):
+    """Em cada fold, a k-ésima amostra de cada letra fica de fora do treino (para letras com mais de k+1)"""
+    labels = np.unique(y)
+    for k in range(folds):
+        test = np.array([np.flatnonzero(y == label)[k] for label in labels if np.sum(y == label) > k + 1])
+        train = np.setdiff1d(np.arange(len(y)), test)
+        yield train, test
+
+def _limit_per_class(train: np.ndarray, y: np.ndarray, per_class: Optional[int]) -> np.ndarray:
+    if per_class is None:
+        return train
+    return np.concatenate([train[y[train] == label][:per_class] for label in np.unique(y[train])])
+
+def evaluate_pipelines(dataset_path: str = "libras_dataset.csv", threshold: int = 5, frames: int = 120,
+                       trials: int = 5, folds: int = 3, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Compara features cruas e normalizadas em amostras que ficaram fora do treino.
+
+    O tamanho de índice reportado é o menor número de amostras de treino
+    com que cada pipeline alcança, com a mão deslocada, a acurácia que o
+    índice cru completo tem nas amostras de teste sem deslocamento.
+    """
+    import pandas as pd
+    from libras_model_loader import LibrasModelLoader
+
+    df = pd.read_csv(dataset_path)
+    X = df.drop('label', axis=1).to_numpy(dtype=np.float64)
+    y = df['label'].astype(str).to_numpy()
+    splits = list(holdout_folds(y, folds))
+
+    # Cada pose de teste em outros lugares/escalas do frame (mesmos para os dois pipelines)
+    rng = np.random.default_rng(seed)
+    displaced = {tuple(test): np.array([placed_elsewhere(X[i], rng) for i in test for _ in range(trials)])
+                 for _, test in splits}
+
+    def accuracy(normalize: bool, per_class: Optional[int] = None, moved: bool = True) -> float:
+        correct = total = 0
+        for train, test in splits:
+            subset = _limit_per_class(train, y, per_class)
+            loader = LibrasModelLoader(model_path=dataset_path, normalize=normalize)
+            loader.fit(X[subset], y[subset])
+            X_test = displaced[tuple(test)] if moved else X[test]
+            y_test = np.repeat(y[test], trials) if moved else y[test]
+            correct += int(np.sum(loader.predict_batch(X_test) == y_test))
+            total += len(y_test)
+        return correct / total
+
+    # Alvo: índice cru completo em poses de teste na posição em que foram gravadas
+    target = accuracy(normalize=False, moved=False)
+    max_per_class = max(int(np.sum(y[train] == label)) for train, _ in splits for label in np.unique(y))
+
+    report = {}
+    for name, normalize in (("cru", False), ("normalizado", True)):
+        # Jogador segurando um sinal de teste em qualquer lugar do frame; sinais
+        # nunca confirmados contam como a simulação inteira
+        confirm_frames = []
+        confirmed = 0
+        sim_rng = np.random.default_rng(seed)
+        for train, test in splits:
+            loader = LibrasModelLoader(model_path=dataset_path, normalize=normalize)
+            loader.fit(X[train], y[train])
+            for i in test:
+                for _ in range(trials):
+                    held = simulate_held_sign(placed_elsewhere(X[i], sim_rng), frames, sim_rng)
+                    result = frames_to_confirm(list(loader.predict_batch(held)), y[i], threshold)
+                    confirmed += result is not None
+                    confirm_frames.append(result if result is not None else frames)
+
+        # Acurácia com a mão deslocada conforme o índice cresce (amostras por letra)
+        curve = [accuracy(normalize, per_class) for per_class in range(1, max_per_class + 1)]
+        needed = next((i + 1 for i, value in enumerate(curve) if value >= target), None)
+
+        report[name] = {
+            "accuracy": accuracy(normalize),
+            "mean_frames_to_confirm": float(np.mean(confirm_frames)),
+            "confirmed": confirmed / len(confirm_frames),
+            "target_accuracy": target,
+            "per_class_for_target": needed,
+            "accuracy_by_per_class": curve,
+        }
+    return report
+
+if __name__ == "__main__":
+    for name, values in evaluate_pipelines().items():
+        print(f"{name:>12}: acurácia com mão deslocada {values['accuracy'] * 100:.1f}% | "
+              f"frames até confirmar (média) {values['mean_frames_to_confirm']:.1f} | "
+              f"sinais confirmados {values['confirmed'] * 100:.0f}% | "
+              f"amostras por letra p/ {values['target_accuracy'] * 100:.0f}% (cru sem deslocamento): "
+              f"{values['per_class_for_target'] or 'não alcançado'}")
+        curve = ", ".join(f"{i + 1}: {value * 100:.0f}%" for i, value in enumerate(values['accuracy_by_per_class']))
+        print(f"{'':>14}acurácia por amostras/letra no índice -> {curve}")
@@ -0,0 +1,325 @@
+import os
+import socket
+import struct
+import threading
+import queue
+import time
+from collections import deque
+from typing import Optional, Tuple, Dict, List
+import cv2
+import numpy as np
+
+# ============== Protocolo binário do daemon de reconhecimento ==============
+# Cada mensagem é um cabeçalho fixo (tipo: uint8, tamanho do payload: uint32,
+# big-endian) seguido do payload. Todos os payloads começam com um timestamp
+# de time.monotonic() (float64), que é comum a todos os processos da máquina
+# e permite medir o atraso do salto IPC no lado do cliente.
+
+SOCKET_PATH = os.environ.get("LIBRAS_SOCKET", "/tmp/libras_daemon.sock")
+
+HEADER = struct.Struct("!BI")
+TIMESTAMP = struct.Struct("!d")
+GESTURE_PAYLOAD = struct.Struct("!dfH") # timestamp, confiança, bits de comandos
+PREVIEW_PAYLOAD = struct.Struct("!dHH") # timestamp, largura, altura
+LETTER_PAYLOAD = struct.Struct("!dddd") # timestamp, início, 1ª previsão, confirmação (NaN = ausente)
+
+MSG_SUBSCRIBE = 1 # cliente -> daemon: payload = uint8 com as assinaturas
+MSG_LANDMARKS = 2 # daemon -> cliente: timestamp + 63 float32 (vazio se não há mão)
+MSG_LETTER = 3    # daemon -> cliente: timestamp, marcos da confirmação + letra estável (utf-8)
+MSG_GESTURE = 4   # daemon -> cliente: timestamp, confiança, comandos + gesto (utf-8)
+MSG_PREVIEW = 5   # daemon -> cliente: timestamp, largura, altura + JPEG
+MSG_PING = 6      # cliente -> daemon: timestamp do cliente
+MSG_PONG = 7      # daemon -> cliente: eco do timestamp recebido
+
+SUB_LANDMARKS = 0x01
+SUB_LETTER = 0x02
+SUB_GESTURE = 0x04
+SUB_PREVIEW = 0x08
+SUB_DEFAULT = SUB_LETTER | SUB_GESTURE
+
+# Ordem dos bits de comandos em MSG_GESTURE (mesmas chaves de get_game_commands)
+COMMAND_KEYS = (
+    'advance_dialogue',
+    'skip_text',
+    'menu',
+    'confirm',
+    'cancel',
+    'move_left',
+    'move_right',
+    'jump',
+    'interact',
+)
+
+MAX_PAYLOAD = 8 * 1024 * 1024
+
+def encode_message(msg_type: int, payload: bytes = b"") -> bytes:
+    return HEADER.pack(msg_type, len(payload)) + payload
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(size - len(buffer))
+        if not chunk:
+            return None
+        buffer.extend(chunk)
+    return bytes(buffer)
+
+def recv_message(sock: socket.socket) -> Optional[Tuple[int, bytes]]:
+    """Lê uma mensagem completa do socket. Retorna None se a conexão fechou."""
+    header = _recv_exact(sock, HEADER.size)
+    if header is None:
+        return None
+    msg_type, size = HEADER.unpack(header)
+    if size > MAX_PAYLOAD:
+        raise ValueError(f"Payload muito grande: {size} bytes")
+    payload = _recv_exact(sock, size) if size else b""
+    if payload is None:
+        return None
+    return msg_type, payload
+
+def encode_landmarks(timestamp: float, landmarks_flat: Optional[List[float]]) -> bytes:
+    payload = TIMESTAMP.pack(timestamp)
+    if landmarks_flat:
+        payload += np.asarray(landmarks_flat, dtype=">f4").tobytes()
+    return encode_message(MSG_LANDMARKS, payload)
+
+def decode_landmarks(payload: bytes) -> Tuple[float, Optional[List[float]]]:
+    timestamp, = TIMESTAMP.unpack_from(payload)
+    if len(payload) == TIMESTAMP.size:
+        return timestamp, None
+    values = np.frombuffer(payload, dtype=">f4", offset=TIMESTAMP.size)
+    return timestamp, values.astype(np.float64).tolist()
+
+# Marcos da telemetria (ver libras_telemetry) enviados com a letra confirmada
+LETTER_MARKS = ("onset", "first_raw", "confirm")
+
+def encode_letter(timestamp: float, letter: str, marks: Optional[Dict[str, Optional[float]]] = None) -> bytes:
+    values = [float("nan")] * len(LETTER_MARKS)
+    if marks:
+        values = [float("nan") if marks.get(name) is None else marks[name] for name in LETTER_MARKS]
+    return encode_message(MSG_LETTER, LETTER_PAYLOAD.pack(timestamp, *values) + letter.encode("utf-8"))
+
+def decode_letter(payload: bytes) -> Tuple[float, str, Optional[Dict[str, Optional[float]]]]:
+    timestamp, *values = LETTER_PAYLOAD.unpack_from(payload)
+    letter = payload[LETTER_PAYLOAD.size:].decode("utf-8")
+    marks = None
+    if not np.isnan(values[-1]): # Sem confirmação, não há marcos
+        marks = {name: None if np.isnan(value) else value for name, value in zip(LETTER_MARKS, values)}
+    return timestamp, letter, marks
+
+def encode_gesture(timestamp: float, gesture: str, confidence: float, commands: Dict[str, bool]) -> bytes:
+    bits = 0
+    for i, key in enumerate(COMMAND_KEYS):
+        if commands.get(key):
+            bits |= 1 << i
+    payload = GESTURE_PAYLOAD.pack(timestamp, confidence, bits) + gesture.encode("utf-8")
+    return encode_message(MSG_GESTURE, payload)
+
+def decode_gesture(payload: bytes) -> Tuple[float, str, float, Dict[str, bool]]:
+    timestamp, confidence, bits = GESTURE_PAYLOAD.unpack_from(payload)
+    gesture = payload[GESTURE_PAYLOAD.size:].decode("utf-8")
+    commands = {key: bool(bits & (1 << i)) for i, key in enumerate(COMMAND_KEYS)}
+    return timestamp, gesture, confidence, commands
+
+def encode_preview(timestamp: float, frame: np.ndarray, quality: int = 70) -> Optional[bytes]:
+    ok, jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        return None
+    height, width = frame.shape[:2]
+    return encode_message(MSG_PREVIEW, PREVIEW_PAYLOAD.pack(timestamp, width, height) + jpeg.tobytes())
+
+def decode_preview(payload: bytes) -> Tuple[float, Optional[np.ndarray]]:
+    timestamp, _, _ = PREVIEW_PAYLOAD.unpack_from(payload)
+    jpeg = np.frombuffer(payload, dtype=np.uint8, offset=PREVIEW_PAYLOAD.size)
+    return timestamp, cv2.imdecode(jpeg, cv2.IMREAD_COLOR)
+
+# ============== Cliente ==============
+
+class LibrasDaemonClient:
+    """Cliente do daemon de reconhecimento de Libras.
+
+    Expõe a mesma interface de leitura do LibrasSignIdentifier
+    (get_game_commands, get_current_frame, get_gesture_info e
+    current_libras_letter), então pode ser usado pelo jogo e pelo
+    LibrasDisplay sem abrir a câmera nem carregar o MediaPipe.
+    """
+
+    def __init__(self, socket_path: str = SOCKET_PATH, subscriptions: int = SUB_DEFAULT):
+        self.socket_path = socket_path
+        self.subscriptions = subscriptions
+        self.sock: Optional[socket.socket] = None
+        self.running = False
+
+        self.current_libras_letter = ""
+        self.letter_marks: Optional[Dict[str, Optional[float]]] = None # Marcos da confirmação da letra
+        self.current_gesture = "none"
+        self.gesture_confidence = 0.0
+        self.current_landmarks: Optional[List[float]] = None
+        self.landmarks_timestamp = 0.0
+        self.current_frame = None
+        self.commands = {key: False for key in COMMAND_KEYS}
+
+        # Atraso (s) entre o daemon publicar e o cliente receber cada mensagem
+        self.delivery_latencies = deque(maxlen=1000)
+
+        self.state_lock = threading.Condition()
+        self.send_lock = threading.Lock()
+        self.pongs = queue.Queue()
+        self.reader_thread: Optional[threading.Thread] = None
+
+    def connect(self, timeout: float = 0.5) -> bool:
+        if not os.path.exists(self.socket_path):
+            return False
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            sock.connect(self.socket_path)
+            sock.settimeout(None)
+        except OSError:
+            return False
+
+        self.sock = sock
+        self.running = True
+        self._send(encode_message(MSG_SUBSCRIBE, bytes([self.subscriptions])))
+        self.reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+        self.reader_thread.start()
+        return True
+
+    def _send(self, data: bytes):
+        with self.send_lock:
+            self.sock.sendall(data)
+
+    def _reader_loop(self):
+        try:
+            while self.running:
+                message = recv_message(self.sock)
+                if message is None:
+                    break
+                self._handle_message(*message)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.running = False
+            with self.state_lock:
+                self.state_lock.notify_all()
+
+    def _handle_message(self, msg_type: int, payload: bytes):
+        now = time.monotonic()
+        if msg_type == MSG_PONG:
+            sent, = TIMESTAMP.unpack(payload)
+            self.pongs.put(now - sent)
+            return
+
+        with self.state_lock:
+            if msg_type == MSG_LANDMARKS:
+                timestamp, self.current_landmarks = decode_landmarks(payload)
+                self.landmarks_timestamp = timestamp
+            elif msg_type == MSG_LETTER:
+                timestamp, self.current_libras_letter, self.letter_marks = decode_letter(payload)
+            elif msg_type == MSG_GESTURE:
+                timestamp, self.current_gesture, self.gesture_confidence, self.commands = decode_gesture(payload)
+            elif msg_type == MSG_PREVIEW:
+                timestamp, self.current_frame = decode_preview(payload)
+            else:
+                return
+            self.delivery_latencies.append(now - timestamp)
+            self.state_lock.notify_all()
+
+    def wait_for_update(self, timeout: float = 1.0) -> bool:
+        """Bloqueia até a próxima mensagem do daemon. Retorna False se desconectado."""
+        with self.state_lock:
+            if self.running:
+                self.state_lock.wait(timeout)
+        return self.running
+
+    def ping(self, timeout: float = 1.0) -> Optional[float]:
+        """Mede o tempo de ida e volta (s) até o daemon."""
+        if not self.running:
+            return None
+        self._send(encode_message(MSG_PING, TIMESTAMP.pack(time.monotonic())))
+        try:
+            return self.pongs.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def get_game_commands(self) -> Dict[str, bool]:
+        with self.state_lock:
+            commands = dict(self.commands)
+            commands["libras_letter"] = self.current_libras_letter
+            commands["libras_marks"] = self.letter_marks
+        return commands
+
+    def get_current_frame(self) -> Optional[np.ndarray]:
+        with self.state_lock:
+            return self.current_frame.copy() if self.current_frame is not None else None
+
+    def get_gesture_info(self) -> Tuple[str, float]:
+        return self.current_gesture, self.gesture_confidence
+
+    def get_landmarks(self) -> Tuple[float, Optional[List[float]]]:
+        with self.state_lock:
+            return self.landmarks_timestamp, self.current_landmarks
+
+    def stop(self):
+        self.running = False
+        if self.sock:
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.sock.close()
+            self.sock = None
+
+# ============== Medição de latência do salto IPC ==============
+
+def _percentiles(samples) -> Dict[str, float]:
+    if not samples:
+        return {}
+    values = np.asarray(samples) * 1000.0
+    return {
+        "n": len(values),
+        "p50_ms": float(np.percentile(values, 50)),
+        "p95_ms": float(np.percentile(values, 95)),
+        "p99_ms": float(np.percentile(values, 99)),
+        "max_ms": float(values.max()),
+    }
+
+def measure_ipc_latency(client: LibrasDaemonClient, samples: int = 500, interval: float = 0.002) -> Dict[str, Dict[str, float]]:
+    """Mede o RTT de ping e o atraso de entrega das mensagens publicadas pelo daemon."""
+    rtts = []
+    for _ in range(samples):
+        rtt = client.ping()
+        if rtt is not None:
+            rtts.append(rtt)
+        time.sleep(interval)
+    return {
+        "ping_rtt": _percentiles(rtts),
+        "one_way_from_rtt": _percentiles([r / 2 for r in rtts]),
+        "delivery": _percentiles(list(client.delivery_latencies)),
+    }
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mede a latência do salto IPC até o daemon de Libras.")
+    parser.add_argument("--socket", default=SOCKET_PATH)
+    parser.add_argument("--samples", type=int, default=500)
+    parser.add_argument("--preview", action="store_true", help="Assinar também os frames de pré-visualização")
+    args = parser.parse_args()
+
+    subscriptions = SUB_LANDMARKS | SUB_LETTER | SUB_GESTURE
+    if args.preview:
+        subscriptions |= SUB_PREVIEW
+    client = LibrasDaemonClient(args.socket, subscriptions)
+    if not client.connect():
+        print(f"Erro: daemon de Libras não encontrado em {args.socket}. Inicie com: python libras_daemon.py")
+        raise SystemExit(1)
+
+    stats = measure_ipc_latency(client, args.samples)
+    client.stop()
+    for name, values in stats.items():
+        if not values:
+            print(f"{name:>18}: sem amostras")
+            continue
+        print(f"{name:>18}: n={values['n']} p50={values['p50_ms']:.3f}ms p95={values['p95_ms']:.3f}ms "
+              f"p99={values['p99_ms']:.3f}ms max={values['max_ms']:.3f}ms")
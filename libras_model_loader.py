@@ -4,10 +4,199 @@ from sklearn.neighbors import KNeighborsClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from libras_features import normalize_landmarks
+
+# Rótulos de erro devolvidos no lugar de uma letra; nunca vão para o cache
+ERROR_LABELS = ("MODELO_NAO_CARREGADO", "FORMATO_INCORRETO")
+
+class QuantizedIndex:
+    """KNN com o conjunto de treino guardado em int8 ou float16 e reordenação exata em float32.
+
+    A passada aproximada percorre só a cópia compacta (int8 com escala e
+    deslocamento por dimensão, ou float16), em blocos convertidos para
+    float32, e guarda os `candidates` vizinhos mais próximos de cada consulta.
+    Esses candidatos são reordenados pela distância exata sobre os vetores
+    em float32, que ficam num arquivo mapeado em memória (np.memmap) em vez
+    de na RAM: só as linhas dos candidatos são lidas do disco. O arquivo é
+    criado em `rerank_dir` a cada fit e removido por close() (ou quando o
+    índice é coletado); se o processo for morto, fica para trás como
+    libras_rerank_*.f32. Com
+    dtype="float32" não há quantização nem arquivo (a cópia percorrida já é
+    exata), o que serve de referência de memória para os outros tipos. Tem a
+    mesma interface que o KNeighborsClassifier usa aqui (fit, predict,
+    predict_proba, classes_), com votos uniformes.
+    """
+
+    CHUNK_ROWS = 4096 # Linhas convertidas por vez (o bloco float32 cabe no cache L2)
+
+    def __init__(self, n_neighbors: int = 5, dtype: str = "int8", candidates: int = 32,
+                 rerank_dir: Optional[str] = None):
+        if dtype not in ("int8", "float16", "float32"):
+            raise ValueError(f"Tipo de índice desconhecido: {dtype}")
+        self.n_neighbors = n_neighbors
+        self.dtype = dtype
+        self.candidates = candidates
+        # Pasta do arquivo de reordenação (None = pasta temporária do sistema)
+        self.rerank_dir = rerank_dir
+        self.rerank_path: Optional[str] = None
+        self.vectors = None
+
+    def fit(self, X: np.ndarray, y: np.ndarray):
+        self.close() # Um novo fit substitui o arquivo do anterior
+        X = np.asarray(X, dtype=np.float32)
+        self.classes_, labels = np.unique(y, return_inverse=True)
+        self.labels = labels.astype(np.min_scalar_type(len(self.classes_)))
+
+        if self.dtype == "float32":
+            self.step = np.ones(X.shape[1], dtype=np.float32)
+            self.offset = np.zeros(X.shape[1], dtype=np.float32)
+            self.codes = X
+            self.vectors = X # A própria cópia percorrida; nada a mais na memória
+        else:
+            self.vectors = self._write_rerank_vectors(X)
+
+        if self.dtype == "int8":
+            low, high = X.min(axis=0), X.max(axis=0)
+            self.step = ((high - low) / 255).astype(np.float32)
+            self.step[self.step == 0] = 1.0
+            self.offset = (low + 128 * self.step).astype(np.float32)
+            self.codes = (np.round((X - low) / self.step) - 128).clip(-128, 127).astype(np.int8)
+        elif self.dtype == "float16":
+            self.step = np.ones(X.shape[1], dtype=np.float32)
+            self.offset = np.zeros(X.shape[1], dtype=np.float32)
+            self.codes = X.astype(np.float16)
+
+        # |x̂|² da versão compacta, para ||q - x̂||² = |x̂|² - 2 q·x̂ + |q|²
+        self.norms = np.empty(len(X), dtype=np.float32)
+        for start, block in self._blocks():
+            decoded = block * self.step + self.offset
+            self.norms[start:start + len(block)] = np.einsum("ij,ij->i", decoded, decoded)
+        return self
+
+    def _write_rerank_vectors(self, X: np.ndarray) -> np.memmap:
+        """Grava X num arquivo e o devolve mapeado só para leitura"""
+        handle, path = tempfile.mkstemp(prefix="libras_rerank_", suffix=".f32", dir=self.rerank_dir)
+        os.close(handle)
+        vectors = np.memmap(path, dtype=np.float32, mode="w+", shape=X.shape)
+        vectors[...] = X
+        vectors.flush()
+        del vectors
+        self.rerank_path = path
+        return np.memmap(path, dtype=np.float32, mode="r", shape=X.shape)
+
+    def close(self):
+        """Remove o arquivo de reordenação; o índice só volta a responder após um novo fit"""
+        path, self.rerank_path = self.rerank_path, None
+        if path is None:
+            return
+        self.vectors = None # Desfaz o mapeamento (o np.memmap não tem close); o Windows exige isso antes de remover
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"Aviso: não foi possível remover {path}: {e}")
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass # Interpretador encerrando
+
+    def _blocks(self):
+        if self.codes.dtype == np.float32:
+            for start in range(0, len(self.codes), self.CHUNK_ROWS):
+                yield start, self.codes[start:start + self.CHUNK_ROWS]
+            return
+        buffer = np.empty((min(self.CHUNK_ROWS, len(self.codes)), self.codes.shape[1]), dtype=np.float32)
+        for start in range(0, len(self.codes), self.CHUNK_ROWS):
+            block = buffer[:len(self.codes[start:start + self.CHUNK_ROWS])]
+            block[...] = self.codes[start:start + self.CHUNK_ROWS]
+            yield start, block
+
+    def _approximate_candidates(self, queries: np.ndarray) -> np.ndarray:
+        """Índices (B, c) dos c vizinhos mais próximos de cada consulta na cópia compacta"""
+        count = min(self.candidates, len(self.codes))
+        weighted = queries * self.step # (B, D)
+        bias = (queries @ self.offset)[:, None] # q·deslocamento, constante por consulta
+        best_distance = np.empty((len(queries), 0), dtype=np.float32)
+        best_index = np.empty((len(queries), 0), dtype=np.int64)
+        for start, block in self._blocks():
+            # -2 q·x̂ + |x̂|²; |q|² não muda a ordem dos vizinhos de uma mesma consulta
+            distance = weighted @ block.T # (B, linhas do bloco)
+            distance += bias
+            distance *= -2
+            distance += self.norms[start:start + len(block)]
+            index = np.arange(start, start + len(block))[None, :]
+            if distance.shape[1] > count:
+                keep = np.argpartition(distance, count - 1, axis=1)[:, :count]
+                distance = np.take_along_axis(distance, keep, axis=1)
+                index = start + keep
+            else:
+                index = np.broadcast_to(index, distance.shape)
+            # Junta com os melhores dos blocos anteriores (no máximo 2c por consulta)
+            distance = np.concatenate([best_distance, distance], axis=1)
+            index = np.concatenate([best_index, index], axis=1)
+            if distance.shape[1] > count:
+                keep = np.argpartition(distance, count - 1, axis=1)[:, :count]
+                distance = np.take_along_axis(distance, keep, axis=1)
+                index = np.take_along_axis(index, keep, axis=1)
+            best_distance, best_index = distance, index
+        return best_index
+
+    def kneighbors(self, X: np.ndarray) -> np.ndarray:
+        queries = np.asarray(X, dtype=np.float32).reshape(-1, self.vectors.shape[1])
+        candidates = self._approximate_candidates(queries)
+        # Lê do arquivo só as linhas dos candidatos
+        rows = np.asarray(self.vectors[candidates.ravel()]).reshape(*candidates.shape, -1)
+        exact = ((rows - queries[:, None, :]) ** 2).sum(axis=2)
+        order = np.argsort(exact, axis=1, kind="stable")[:, :self.n_neighbors]
+        return np.take_along_axis(candidates, order, axis=1)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        neighbors = self.kneighbors(X)
+        votes = np.zeros((len(neighbors), len(self.classes_)))
+        rows = np.repeat(np.arange(len(neighbors)), neighbors.shape[1])
+        np.add.at(votes, (rows, self.labels[neighbors].ravel()), 1.0 / neighbors.shape[1])
+        return votes
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes na RAM; os vetores de reordenação ficam no disco (ver disk_nbytes)"""
+        return sum(a.nbytes for a in (self.codes, self.norms, self.labels, self.step, self.offset))
+
+    @property
+    def disk_nbytes(self) -> int:
+        return self.vectors.nbytes if self.rerank_path else 0
+
+def index_nbytes(model) -> int:
+    """Memória do conjunto de treino guardado pelo classificador (bytes)"""
+    if isinstance(model, QuantizedIndex):
+        return model.nbytes
+    # O KNeighborsClassifier guarda uma cópia float64 de X e um rótulo inteiro por amostra
+    return model.n_samples_fit_ * (model.n_features_in_ * np.dtype(np.float64).itemsize + np.dtype(np.intp).itemsize)
+
+def index_scan_nbytes(model) -> int:
+    """Bytes percorridos a cada consulta (a reordenação lê só as linhas dos candidatos)"""
+    if isinstance(model, QuantizedIndex):
+        return model.codes.nbytes
+    return model.n_samples_fit_ * model.n_features_in_ * np.dtype(np.float64).itemsize
 
 class LibrasModelLoader:
-    def __init__(self, model_path='libras_dataset.csv'):
+    def __init__(self, model_path='libras_dataset.csv', normalize: bool = True, index: Optional[str] = None,
+                 rerank_dir: Optional[str] = None):
         self.model_path = model_path
+        # Features relativas ao pulso e ao tamanho da palma (ver libras_features)
+        self.normalize = normalize
+        # None = KNN exato do sklearn; "int8"/"float16"/"float32" = QuantizedIndex
+        self.index = index
+        # Pasta do arquivo de reordenação do int8/float16 (None = pasta temporária do sistema)
+        self.rerank_dir = rerank_dir
         self.model = None
         self.scaler = None
         self.load_model()
@@ -21,32 +210,278 @@ class LibrasModelLoader:
             X = df.drop('label', axis=1)
             y = df['label']
 
-            self.scaler = StandardScaler()
-            X_scaled = self.scaler.fit_transform(X)
-
-            # Usar um modelo simples como KNN para demonstração
-            self.model = KNeighborsClassifier(n_neighbors=5)
-            self.model.fit(X_scaled, y)
+            self.fit(X.to_numpy(dtype=np.float64), y.to_numpy())
             print("Modelo de Libras carregado com sucesso!")
         except Exception as e:
             print(f"Erro ao carregar o modelo de Libras: {e}")
             self.model = None
 
-    def predict(self, hand_landmarks_flat: list) -> str:
+    def fit(self, X: np.ndarray, y: np.ndarray):
+        """Treina o scaler e o KNN a partir de landmarks crus (N, 63)"""
+        self.scaler = StandardScaler()
+        X_scaled = self.scaler.fit_transform(self.features(X))
+
+        # Usar um modelo simples como KNN para demonstração
+        if isinstance(self.model, QuantizedIndex):
+            self.model.close()
+        if self.index:
+            self.model = QuantizedIndex(n_neighbors=min(5, len(X)), dtype=self.index, rerank_dir=self.rerank_dir)
+        else:
+            self.model = KNeighborsClassifier(n_neighbors=min(5, len(X)))
+        self.model.fit(X_scaled, y)
+
+    def features(self, hand_landmarks_flat) -> np.ndarray:
+        """Converte landmarks crus (63,) ou (N, 63) nas features usadas pelo modelo"""
+        if self.normalize:
+            return normalize_landmarks(hand_landmarks_flat)
+        return np.asarray(hand_landmarks_flat, dtype=np.float64)
+
+    def scale(self, features: np.ndarray) -> np.ndarray:
+        """Aplica a normalização do StandardScaler direto com NumPy (sem a validação do sklearn)"""
+        input_data = np.asarray(features, dtype=np.float64)
+        input_data = input_data.reshape(-1, input_data.shape[-1])
+        if input_data.shape[1] != self.scaler.n_features_in_:
+            raise ValueError(f"Esperado {self.scaler.n_features_in_} valores, recebido {input_data.shape[1]}")
+        return (input_data - self.scaler.mean_) / self.scaler.scale_
+
+    def predict_scaled(self, input_scaled: np.ndarray) -> Tuple[str, Dict[str, float]]:
+        """Classifica um vetor já normalizado e retorna a letra e a distribuição de votos dos vizinhos"""
+        votes = self.model.predict_proba(input_scaled)[0]
+        best = int(np.argmax(votes))
+        distribution = {str(label): float(v) for label, v in zip(self.model.classes_, votes) if v > 0}
+        return str(self.model.classes_[best]), distribution
+
+    def predict_features(self, features: np.ndarray) -> Tuple[str, Dict[str, float]]:
         if self.model is None or self.scaler is None:
-            return "MODELO_NAO_CARREGADO"
+            return "MODELO_NAO_CARREGADO", {}
+        try:
+            return self.predict_scaled(self.scale(features))
+        except Exception as e:
+            # print(f"Erro ao prever letra de Libras: {e}") # Para debug
+            return "FORMATO_INCORRETO", {}
+
+    def predict_with_votes(self, hand_landmarks_flat: list) -> Tuple[str, Dict[str, float]]:
+        if self.model is None or self.scaler is None:
+            return "MODELO_NAO_CARREGADO", {}
         try:
             # Converter landmarks para o formato esperado pelo modelo
             # Certifique-se de que a ordem e o número de landmarks correspondam ao treinamento
-            input_data = np.array(hand_landmarks_flat).reshape(1, -1)
-            input_scaled = self.scaler.transform(input_data)
-            prediction = self.model.predict(input_scaled)
-            return str(prediction[0])
+            features = self.features(hand_landmarks_flat)
         except Exception as e:
-            # print(f"Erro ao prever letra de Libras: {e}") # Para debug
-            return "FORMATO_INCORRETO"
+            return "FORMATO_INCORRETO", {}
+        return self.predict_features(features)
+
+    def predict(self, hand_landmarks_flat: list) -> str:
+        return self.predict_with_votes(hand_landmarks_flat)[0]
+
+    def predict_batch(self, landmarks_batch: np.ndarray) -> np.ndarray:
+        """Classifica um lote (N, 63) de landmarks crus de uma vez"""
+        return self.model.predict(self.scale(self.features(landmarks_batch))).astype(str)
+
+class PredictionCache:
+    """Cache de coerência temporal na frente de LibrasModelLoader.predict.
+
+    Enquanto o jogador segura um sinal, os landmarks quase não mudam entre
+    frames. Se o vetor de features do modelo (relativo ao pulso e em
+    unidades de tamanho da palma, ver libras_features) se moveu menos que
+    `tolerance` (RMS) desde o último frame classificado, a letra e os votos
+    anteriores são reaproveitados; mover a mão sem mudar a pose também
+    acerta o cache. Poses revisitadas são encontradas num LRU pequeno,
+    indexado pelo vetor quantizado em passos de `quantization`. Com
+    `verify_every` > 0, a cada N acertos uma classificação real é forçada
+    para conferir o cache.
+    """
+
+    def __init__(self, model_loader: LibrasModelLoader, tolerance: float = 0.05, quantization: float = 0.1,
+                 lru_size: int = 64, verify_every: int = 0):
+        self.model_loader = model_loader
+        self.tolerance = tolerance
+        self.quantization = quantization
+        self.lru_size = lru_size
+        self.verify_every = verify_every
+
+        self.last_vector: Optional[np.ndarray] = None
+        self.last_result: Optional[Tuple[str, Dict[str, float]]] = None
+        self.lru: "OrderedDict[bytes, Tuple[str, Dict[str, float]]]" = OrderedDict()
+
+        self.temporal_hits = 0
+        self.lru_hits = 0
+        self.misses = 0
+        self.classify_time = 0.0 # Tempo total gasto em classificações reais (s)
+        self.saved_time = 0.0    # Estimativa do tempo economizado pelos acertos (s)
+        self.hits_since_check = 0
+        self.checks = 0
+        self.check_mismatches = 0
+
+    def clear(self):
+        self.last_vector = None
+        self.last_result = None
+        self.lru.clear()
+
+    def _classify(self, vector: np.ndarray) -> Tuple[str, Dict[str, float]]:
+        start = time.perf_counter()
+        result = self.model_loader.predict_features(vector)
+        self.classify_time += time.perf_counter() - start
+        return result
+
+    def _hit(self, vector: np.ndarray, result: Tuple[str, Dict[str, float]],
+             key: Optional[bytes] = None) -> Tuple[str, Dict[str, float]]:
+        self.hits_since_check += 1
+        if self.verify_every and self.hits_since_check >= self.verify_every:
+            # Verificação de consistência: classifica de verdade e compara
+            self.hits_since_check = 0
+            self.checks += 1
+            fresh = self._classify(vector)
+            if fresh[0] != result[0]:
+                self.check_mismatches += 1
+                # Corrige a entrada do LRU que gerou o acerto divergente
+                if key is not None:
+                    if fresh[0] in ERROR_LABELS:
+                        self.lru.pop(key, None)
+                    else:
+                        self.lru[key] = fresh
+            return fresh
+        if self.misses:
+            self.saved_time += self.classify_time / (self.misses + self.checks)
+        return result
+
+    def predict_with_votes(self, hand_landmarks_flat: list) -> Tuple[str, Dict[str, float]]:
+        if self.model_loader.model is None or self.model_loader.scaler is None:
+            return "MODELO_NAO_CARREGADO", {}
+        try:
+            vector = self.model_loader.features(hand_landmarks_flat)
+        except Exception:
+            return "FORMATO_INCORRETO", {}
+
+        if self.last_vector is not None and vector.shape == self.last_vector.shape:
+            distance = np.sqrt(np.mean((vector - self.last_vector) ** 2))
+            if distance < self.tolerance:
+                self.temporal_hits += 1
+                # Não atualiza last_vector: o desvio é medido contra o último frame classificado
+                result = self._hit(vector, self.last_result)
+                if result[0] in ERROR_LABELS:
+                    self.last_vector = None
+                    self.last_result = None
+                else:
+                    self.last_result = result
+                return result
+
+        key = np.round(vector / self.quantization).astype(np.int16).tobytes()
+        cached = self.lru.get(key)
+        if cached is not None:
+            self.lru_hits += 1
+            self.lru.move_to_end(key)
+            result = self._hit(vector, cached, key)
+        else:
+            self.misses += 1
+            result = self._classify(vector)
+            if result[0] not in ERROR_LABELS:
+                self.lru[key] = result
+                if len(self.lru) > self.lru_size:
+                    self.lru.popitem(last=False)
+
+        if result[0] in ERROR_LABELS:
+            # Erro não é previsão: não reaproveitar entre frames
+            self.last_vector = None
+            self.last_result = None
+            return result
+        self.last_vector = vector
+        self.last_result = result
+        return result
+
+    def predict(self, hand_landmarks_flat: list) -> str:
+        return self.predict_with_votes(hand_landmarks_flat)[0]
+
+    def get_stats(self) -> Dict[str, float]:
+        hits = self.temporal_hits + self.lru_hits
+        total = hits + self.misses
+        return {
+            "requests": total,
+            "temporal_hits": self.temporal_hits,
+            "lru_hits": self.lru_hits,
+            "misses": self.misses,
+            "hit_rate": hits / total if total else 0.0,
+            "saved_time_s": self.saved_time,
+            "checks": self.checks,
+            "check_mismatches": self.check_mismatches,
+        }
+
+def benchmark_index(dataset_path: str = 'libras_dataset.csv', sizes=(1000, 10000, 50000, 200000),
+                    queries: int = 500, seed: int = 0) -> Dict[int, Dict[str, Dict[str, float]]]:
+    """Memória, latência e concordância com o KNN exato para datasets sintéticos crescentes.
+
+    "float32" é a referência de memória: a matriz float32 simples, percorrida
+    inteira, sem quantização nem reordenação.
+
+    Cada amostra é uma pose do dataset em outra posição/escala do frame com
+    tremor nos landmarks, como se mais jogadores tivessem coletado dados.
+    """
+    from libras_features import placed_elsewhere
+
+    df = pd.read_csv(dataset_path)
+    X = df.drop('label', axis=1).to_numpy(dtype=np.float64)
+    y = df['label'].astype(str).to_numpy()
+    rng = np.random.default_rng(seed)
+
+    def synthesize(n: int) -> Tuple[np.ndarray, np.ndarray]:
+        rows = rng.integers(0, len(X), n)
+        samples = np.array([placed_elsewhere(X[i], rng) for i in rows]) + rng.normal(0, 0.005, (n, X.shape[1]))
+        return samples, y[rows]
+
+    X_query, _ = synthesize(queries)
+    report = {}
+    for size in sizes:
+        X_train, y_train = synthesize(size)
+        results = {}
+        for name in ("exato", "float32", "int8", "float16"):
+            loader = LibrasModelLoader(model_path=dataset_path, index=None if name == "exato" else name)
+            loader.fit(X_train, y_train)
+
+            single = []
+            for row in X_query[:100]:
+                start = time.perf_counter()
+                loader.predict(row)
+                single.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            labels = loader.predict_batch(X_query)
+            batch_time = time.perf_counter() - start
+
+            results[name] = {
+                "memory_mb": index_nbytes(loader.model) / (1024 * 1024),
+                "disk_mb": getattr(loader.model, "disk_nbytes", 0) / (1024 * 1024),
+                "scan_mb": index_scan_nbytes(loader.model) / (1024 * 1024),
+                "single_ms": float(np.median(single)) * 1000,
+                "batch_us": batch_time / len(X_query) * 1e6,
+                "labels": labels,
+            }
+            if isinstance(loader.model, QuantizedIndex):
+                loader.model.close()
+        exact_labels = results["exato"]["labels"]
+        for values in results.values():
+            values["agreement"] = float(np.mean(values.pop("labels") == exact_labels))
+        report[size] = results
+    return report
 
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Teste do carregador de modelo e do cache de previsões.")
+    parser.add_argument("--index-benchmark", action="store_true",
+                        help="Compara o KNN exato com os índices float32/int8/float16 em datasets crescentes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000, 200000])
+    args = parser.parse_args()
+
+    if args.index_benchmark:
+        print(f"{'amostras':>9}{'índice':>9}{'memória':>11}{'disco':>11}{'varredura':>11}{'1 amostra':>11}"
+              f"{'lote/amostra':>14}{'concordância':>14}")
+        for size, results in benchmark_index(sizes=args.sizes).items():
+            for name, values in results.items():
+                print(f"{size:>9}{name:>9}{values['memory_mb']:>9.2f}MB{values['disk_mb']:>9.2f}MB"
+                      f"{values['scan_mb']:>9.2f}MB"
+                      f"{values['single_ms']:>9.2f}ms"
+                      f"{values['batch_us']:>12.1f}us{values['agreement'] * 100:>13.1f}%")
+        raise SystemExit(0)
+
     # Exemplo de uso e teste do carregador de modelo
     # Certifique-se de ter um libras_dataset.csv válido para testar
     model_loader = LibrasModelLoader()
@@ -56,6 +491,22 @@ if __name__ == '__main__':
         dummy_landmarks = [0.5] * 63 # 21 landmarks * 3 coordenadas (x,y,z)
         predicted_letter = model_loader.predict(dummy_landmarks)
         print(f"Letra prevista: {predicted_letter}")
+
+        # Simula o jogador segurando cada sinal do dataset por 60 frames, com
+        # um pequeno tremor, para medir a taxa de acerto do cache. O z do
+        # pulso é a referência de profundidade do MediaPipe e fica sempre ~0.
+        df = pd.read_csv(model_loader.model_path)
+        rng = np.random.default_rng(0)
+        cache = PredictionCache(model_loader, verify_every=30)
+        for row in df.drop('label', axis=1).to_numpy():
+            for _ in range(60):
+                jitter = rng.normal(0, 0.002, row.shape)
+                jitter[2] = 0.0
+                cache.predict(row + jitter)
+        stats = cache.get_stats()
+        print(f"Cache: {stats['hit_rate'] * 100:.1f}% de acertos em {stats['requests']} frames, "
+              f"{stats['saved_time_s'] * 1000:.0f}ms economizados, "
+              f"{stats['check_mismatches']}/{stats['checks']} divergências nas verificações")
     else:
         print("Falha ao carregar o modelo.")
 
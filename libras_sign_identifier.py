@@ -1,14 +1,18 @@
 import cv2
 import mediapipe as mp
 import numpy as np
-import pygame
 from typing import Optional, Tuple, Dict, List
 import threading
 import time
-from libras_model_loader import LibrasModelLoader
+from libras_model_loader import LibrasModelLoader, PredictionCache
+from libras_capture import HandRoiTracker
+from libras_features import extract_landmarks, get_handedness
+from libras_telemetry import SignTelemetry
+# Reexportado: o widget fica num módulo leve para o jogo não importar o MediaPipe só para desenhá-lo
+from libras_display import LibrasDisplay
 
 class LibrasSignIdentifier:
-    def __init__(self):
+    def __init__(self, roi_tracking: bool = True, telemetry: Optional[SignTelemetry] = None):
         self.running = False
         
         self.mp_hands = mp.solutions.hands
@@ -19,12 +23,36 @@ class LibrasSignIdentifier:
             min_tracking_confidence=0.5
         )
         self.mp_drawing = mp.solutions.drawing_utils
+
+        # Detecção em frame reduzido + rastreamento em recorte ao redor da mão; o
+        # recorte tem um grafo próprio para não misturar coordenadas no rastreamento
+        self.roi_hands = None
+        if roi_tracking:
+            self.roi_hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=1,
+                min_detection_confidence=0.7,
+                min_tracking_confidence=0.5
+            )
+        self.roi_tracker = HandRoiTracker(self.hands, self.roi_hands) if roi_tracking else None
         
         self.libras_model_loader = LibrasModelLoader(model_path="libras_dataset.csv")
+        # Reaproveita a classificação enquanto a pose da mão não muda
+        self.prediction_cache = PredictionCache(self.libras_model_loader, verify_every=30)
+        self.libras_votes: Dict[str, float] = {} # Distribuição de votos da última classificação
         self.current_libras_letter = ""
         self.libras_letter_history = []
         self.libras_stability_threshold = 5 # Frames consecutivos para confirmar a letra
-        
+
+        # Tempos de detecção, previsão e confirmação (o jogo registra o commit)
+        self.telemetry = telemetry if telemetry is not None else SignTelemetry()
+        self.telemetry.set_config("stability_threshold_frames", self.libras_stability_threshold)
+        self.last_frame_time: Optional[float] = None
+        
+        # Posição horizontal da mão (0 = esquerda da imagem espelhada) para andar no platformer
+        self.hand_x: Optional[float] = None
+        self.move_zone = 0.35 # Mão no terço esquerdo/direito da imagem anda para o lado
+
         self.current_gesture = "none"
         self.gesture_confidence = 0.0
         self.gesture_history = []
@@ -45,19 +73,32 @@ class LibrasSignIdentifier:
         
         self.frame_lock = threading.Lock()
         self.current_frame = None
+        self.current_landmarks: Optional[List[float]] = None # Landmarks da última mão detectada
         
-    def _get_hand_landmarks_flat(self, hand_landmarks) -> List[float]:
-        landmarks_flat = []
-        for landmark in hand_landmarks.landmark:
-            landmarks_flat.extend([landmark.x, landmark.y, landmark.z])
-        return landmarks_flat
+    def _get_hand_landmarks_flat(self, hand_landmarks, handedness: Optional[str] = None) -> List[float]:
+        # Mãos esquerdas são espelhadas para a mão canônica do dataset
+        return extract_landmarks(hand_landmarks, handedness)
 
-    def detect_libras_letter(self, hand_landmarks) -> str:
+    def detect_libras_letter(self, hand_landmarks, handedness: Optional[str] = None) -> str:
+        return self.classify_landmarks(self._get_hand_landmarks_flat(hand_landmarks, handedness))
+
+    def classify_landmarks(self, landmarks_flat: List[float]) -> str:
         if self.libras_model_loader.model is None:
             return "MODELO_NAO_CARREGADO"
-        
-        landmarks_flat = self._get_hand_landmarks_flat(hand_landmarks)
-        return self.libras_model_loader.predict(landmarks_flat)
+
+        letter, self.libras_votes = self.prediction_cache.predict_with_votes(landmarks_flat)
+        return letter
+
+    def warm_up(self, frame: Optional[np.ndarray] = None):
+        """Executa uma inferência descartável para carregar os grafos do MediaPipe e o classificador"""
+        if frame is None:
+            frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        if self.roi_hands is not None:
+            # O grafo dos recortes também paga a primeira inferência; aquece com um recorte do mesmo tamanho
+            size = self.roi_tracker.roi_size
+            self.roi_hands.process(np.zeros((size, size, 3), dtype=np.uint8))
+        self.libras_model_loader.predict([0.0] * 63)
 
     def update_libras_stability(self, letter: str):
         self.libras_letter_history.append(letter)
@@ -65,9 +106,12 @@ class LibrasSignIdentifier:
         if len(self.libras_letter_history) > self.libras_stability_threshold:
             self.libras_letter_history.pop(0)
         
+        self.telemetry.raw_prediction(letter)
         if len(self.libras_letter_history) >= self.libras_stability_threshold:
             recent_letters = self.libras_letter_history
             if all(l == letter for l in recent_letters) and letter not in ["MODELO_NAO_CARREGADO", "FORMATO_INCORRETO"]:
+                # Registrado antes de publicar a letra, para o commit do jogo nunca chegar primeiro
+                self.telemetry.confirmed(letter)
                 self.current_libras_letter = letter
             else:
                 self.current_libras_letter = ""
@@ -143,23 +187,34 @@ class LibrasSignIdentifier:
     def process_frame(self, frame):
         if frame is None:
             return
-        
-        # Espelhar horizontalmente para melhor experiência do usuário
-        frame = cv2.flip(frame, 1)
-        
-        # Converter BGR para RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Processar com MediaPipe
-        results = self.hands.process(rgb_frame)
+
+        frame_start = time.monotonic()
+        interval = frame_start - self.last_frame_time if self.last_frame_time is not None else None
+        self.last_frame_time = frame_start
+
+        if self.roi_tracker is not None:
+            # O frame devolvido é a pré-visualização reduzida e espelhada;
+            # os landmarks já vêm em coordenadas do frame inteiro
+            results, frame = self.roi_tracker.process(frame)
+        else:
+            # Espelhar horizontalmente para melhor experiência do usuário
+            frame = cv2.flip(frame, 1)
+
+            # Converter BGR para RGB
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+            # Processar com MediaPipe
+            results = self.hands.process(rgb_frame)
         
         gesture = "none"
         confidence = 0.0
         libras_letter = ""
+        landmarks_flat = None
+        hand_x = None
         
         # Desenhar landmarks e detectar gestos
         if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
+            for i, hand_landmarks in enumerate(results.multi_hand_landmarks):
                 # Desenhar landmarks
                 self.mp_drawing.draw_landmarks(
                     frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS
@@ -167,9 +222,11 @@ class LibrasSignIdentifier:
                 
                 # Detectar gesto
                 gesture, confidence = self.detect_gesture(hand_landmarks.landmark)
+                hand_x = hand_landmarks.landmark[9].x # Base do dedo médio, centro da palma
                 
                 # Detectar letra de Libras
-                libras_letter = self.detect_libras_letter(hand_landmarks)
+                landmarks_flat = self._get_hand_landmarks_flat(hand_landmarks, get_handedness(results, i))
+                libras_letter = self.classify_landmarks(landmarks_flat)
                 self.update_libras_stability(libras_letter)
 
                 # Adicionar texto com o gesto detectado
@@ -178,11 +235,17 @@ class LibrasSignIdentifier:
                 cv2.putText(frame, f"Libras: {self.current_libras_letter}", 
                            (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
         
+        if landmarks_flat is None:
+            self.telemetry.hand_lost()
+        self.telemetry.observe_frame(interval, time.monotonic() - frame_start)
+
         # Atualizar estabilidade do gesto
         self.update_gesture_stability(gesture, confidence)
         
+        self.hand_x = hand_x
         with self.frame_lock:
             self.current_frame = frame
+            self.current_landmarks = landmarks_flat
     
     def get_game_commands(self) -> Dict[str, bool]:
         for key in self.game_commands:
@@ -204,6 +267,12 @@ class LibrasSignIdentifier:
                 self.game_commands["cancel"] = True
             elif self.current_gesture == "two":
                 pass
+
+        # Andar: qualquer sinal feito perto da borda esquerda/direita da imagem (espelhada)
+        hand_x = self.hand_x
+        if hand_x is not None:
+            self.game_commands["move_left"] = hand_x < self.move_zone
+            self.game_commands["move_right"] = hand_x > 1 - self.move_zone
         
         self.game_commands["libras_letter"] = self.current_libras_letter
         
@@ -216,52 +285,11 @@ class LibrasSignIdentifier:
     def get_gesture_info(self) -> Tuple[str, float]:
         return self.current_gesture, self.gesture_confidence
 
-class LibrasDisplay:
-    def __init__(self, controller: LibrasSignIdentifier, position: Tuple[int, int], size: Tuple[int, int]):
-        self.controller = controller
-        self.position = position
-        self.size = size
-        self.visible = True
-        
-    def toggle_visibility(self):
-        self.visible = not self.visible
-    
-    def draw(self, surface: pygame.Surface):
-        if not self.visible:
-            return
-        
-        frame = self.controller.get_current_frame()
-        if frame is None:
-            return
-        
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame_resized = cv2.resize(frame_rgb, self.size)
-        frame_surface = pygame.surfarray.make_surface(frame_resized.swapaxes(0, 1))
-        
-        surface.blit(frame_surface, self.position)
-        
-        gesture, confidence = self.controller.get_gesture_info()
-        libras_letter = self.controller.current_libras_letter
-
-        font = pygame.font.Font(None, 24)
-        y_offset = self.position[1] + self.size[1] + 5
-
-        if gesture != "none":
-            text = f"Gesto: {gesture} ({confidence:.2f})"
-            text_surface = font.render(text, True, (255, 255, 255))
-            text_rect = text_surface.get_rect()
-            text_rect.topleft = (self.position[0], y_offset)
-            pygame.draw.rect(surface, (0, 0, 0), text_rect.inflate(10, 5))
-            surface.blit(text_surface, text_rect)
-            y_offset += text_rect.height + 5
-            
-        if libras_letter:
-            text = f"Libras: {libras_letter}"
-            text_surface = font.render(text, True, (255, 255, 0))
-            text_rect = text_surface.get_rect()
-            text_rect.topleft = (self.position[0], y_offset)
-            pygame.draw.rect(surface, (0, 0, 0), text_rect.inflate(10, 5))
-            surface.blit(text_surface, text_rect)
+    def stop(self):
+        self.running = False
+        self.hands.close()
+        if self.roi_hands is not None:
+            self.roi_hands.close()
 
 if __name__ == "__main__":
     # Este bloco não será executado diretamente no jogo, mas é útil para testes isolados
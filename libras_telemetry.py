@@ -0,0 +1,404 @@
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# ============== Telemetria: do início do sinal até a letra entrar no nome ==============
+# Cada tentativa de soletrar uma letra passa por quatro marcos:
+#   início      -> a mão aparece (ou o sinal anterior termina com a mão ainda no quadro)
+#   1ª previsão -> o classificador prevê a letra pela primeira vez nesta tentativa
+#   confirmação -> a letra fica estável por libras_stability_threshold frames
+#   commit      -> o jogo adiciona a letra em player_name (após LETTER_ADD_DELAY)
+# As latências de cada etapa são agregadas por letra em histogramas e gravadas
+# periodicamente num arquivo no formato texto do Prometheus. Cada sessão grava
+# o próprio arquivo; o da sessão anterior vira .1, .2, ... (rotação).
+
+METRICS_PATH = "libras_metrics.prom"
+LATENCY_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+FRAME_BUCKETS = (0.005, 0.01, 0.02, 0.035, 0.05, 0.075, 0.1, 0.2, 0.5)
+
+# Etapas registradas no commit: (nome, marco inicial, marco final)
+STAGES = (
+    ("detection", "onset", "first_raw"),
+    ("stabilization", "first_raw", "confirm"),
+    ("commit_delay", "confirm", "commit"),
+    ("total", "onset", "commit"),
+)
+
+class Histogram:
+    """Histograma cumulativo no estilo Prometheus (contagens por limite superior `le`)"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1) # Último = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+def rotate_files(path: str, backups: int):
+    """path -> path.1 -> path.2 ... mantendo no máximo `backups` arquivos antigos"""
+    if not os.path.exists(path):
+        return
+    for i in range(backups - 1, 0, -1):
+        if os.path.exists(f"{path}.{i}"):
+            os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+    if backups > 0:
+        os.replace(path, f"{path}.1")
+
+class SignTelemetry:
+    """Marca os tempos de cada tentativa de letra e exporta as distribuições por letra.
+
+    Alimentada pelo LibrasSignIdentifier (mão detectada, previsões cruas e
+    confirmação) e pelo CandangoGame (commit e letras apagadas). Segura para
+    uso a partir da thread de reconhecimento e da thread do jogo. Sem `path`,
+    as métricas ficam só em memória.
+
+    No daemon não há commit: use `commits=False`, e os marcos de cada
+    confirmação (confirmation_marks) vão junto com a letra para o jogo, que
+    os passa a confirmed(letter, marks=...) e registra as quatro etapas.
+    """
+
+    def __init__(self, path: Optional[str] = None, flush_interval: float = 10.0, backups: int = 5,
+                 commits: bool = True):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.backups = backups
+        # False no processo que só reconhece (daemon): nada é abandonado por falta de commit
+        self.track_commits = commits
+        self.rotated = False
+        self.lock = threading.Lock()
+        self.session_start = time.time()
+        self.last_flush = time.monotonic()
+
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.frame: Dict[str, Histogram] = {}
+        self.commits: Dict[str, int] = {}
+        self.false_commits: Dict[str, int] = {}
+        self.abandoned: Dict[str, int] = {} # Confirmadas, mas a mão saiu (ou trocou de letra) antes do commit
+        self.config: Dict[str, float] = {}
+
+        # Tentativa em andamento
+        self.onset: Optional[float] = None # Mão detectada
+        self.active_letter = "" # Última letra confirmada com a mão no quadro
+        self.active_end: Optional[float] = None # 1º frame após a última previsão de active_letter
+        self.first_raw: Dict[str, float] = {} # 1ª previsão de cada letra desde então
+        self.pending: Optional[Dict[str, float]] = None # Confirmada e ainda sem commit
+        self.pending_letter = ""
+        self.last_confirmation: Optional[Tuple[str, Dict[str, Optional[float]]]] = None
+        self.remote_confirm: Optional[float] = None # Marco de confirmação do último `marks` recebido
+
+    # ---------- Eventos ----------
+
+    def set_config(self, name: str, value: float):
+        with self.lock:
+            self.config[name] = float(value)
+
+    def observe_frame(self, interval: Optional[float], processing: float):
+        """Intervalo entre frames da câmera e tempo de processamento (MediaPipe + classificador)"""
+        with self.lock:
+            if interval is not None:
+                self.frame.setdefault("interval", Histogram(FRAME_BUCKETS)).observe(interval)
+            self.frame.setdefault("processing", Histogram(FRAME_BUCKETS)).observe(processing)
+
+    def hand_lost(self):
+        with self.lock:
+            self._abandon_pending()
+            self.onset = None
+            self.active_letter = ""
+            self.active_end = None
+            self.first_raw = {}
+
+    def raw_prediction(self, letter: str, t: Optional[float] = None):
+        t = time.monotonic() if t is None else t
+        with self.lock:
+            if self.onset is None:
+                self.onset = t
+            if self.active_letter and letter == self.active_letter:
+                # O sinal anterior ainda está no quadro; oscilações curtas não encerram a tentativa
+                self.active_end = None
+                self.first_raw = {}
+                return
+            if self.active_letter and self.active_end is None:
+                self.active_end = t
+            self.first_raw.setdefault(letter, t)
+
+    def confirmed(self, letter: str, t: Optional[float] = None, marks: Optional[Dict[str, Optional[float]]] = None):
+        """Letra estável; repetir a mesma letra da tentativa atual não conta de novo.
+
+        `marks` ({"onset", "first_raw", "confirm"}, em time.monotonic()) vem de
+        outro processo, como o daemon; a mesma confirmação recebida de novo é ignorada.
+        """
+        t = time.monotonic() if t is None else t
+        with self.lock:
+            if not letter:
+                return
+            if marks is not None:
+                if marks["confirm"] == self.remote_confirm:
+                    return
+                self.remote_confirm = marks["confirm"]
+            elif letter == self.active_letter:
+                return
+            else:
+                # Com a mão no quadro, o sinal começa quando o anterior deixou de ser previsto
+                onset = self.active_end if self.active_letter else self.onset
+                marks = {"onset": onset, "first_raw": self.first_raw.get(letter), "confirm": t}
+                self.active_letter = letter
+                self.active_end = None
+                self.first_raw = {}
+            self._abandon_pending()
+            self.pending = dict(marks)
+            self.pending_letter = letter
+            self.last_confirmation = (letter, dict(marks))
+
+    def confirmation_marks(self, letter: str) -> Optional[Dict[str, Optional[float]]]:
+        """Marcos da última confirmação, se ela for de `letter` (publicados pelo daemon)"""
+        with self.lock:
+            if self.last_confirmation is None or self.last_confirmation[0] != letter:
+                return None
+            return dict(self.last_confirmation[1])
+
+    def committed(self, letter: str, t: Optional[float] = None):
+        t = time.monotonic() if t is None else t
+        with self.lock:
+            self.commits[letter] = self.commits.get(letter, 0) + 1
+            if self.pending is None or self.pending_letter != letter:
+                return # Repetição da mesma letra segurada: só conta o commit
+            marks = dict(self.pending, commit=t)
+            self.pending = None
+            for stage, start, end in STAGES:
+                if marks[start] is not None and marks[end] is not None:
+                    key = (letter, stage)
+                    self.latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(max(0.0, marks[end] - marks[start]))
+
+    def false_commit(self, letter: str):
+        """Letra adicionada por engano (o jogador apagou)"""
+        with self.lock:
+            self.false_commits[letter] = self.false_commits.get(letter, 0) + 1
+
+    def _abandon_pending(self):
+        if self.pending is not None and self.track_commits:
+            self.abandoned[self.pending_letter] = self.abandoned.get(self.pending_letter, 0) + 1
+            self.pending = None
+
+    # ---------- Exportação ----------
+
+    def render(self) -> str:
+        """Métricas no formato texto do Prometheus"""
+        with self.lock:
+            lines = [
+                "# HELP libras_telemetry_session_start_seconds Início da sessão (Unix).",
+                "# TYPE libras_telemetry_session_start_seconds gauge",
+                f"libras_telemetry_session_start_seconds {self.session_start:.3f}",
+                "# HELP libras_config Parâmetros que afetam a latência.",
+                "# TYPE libras_config gauge",
+            ]
+            for name, value in sorted(self.config.items()):
+                lines.append(f"libras_config{_format_labels({'name': name})} {value!r}")
+
+            lines += [
+                "# HELP libras_sign_latency_seconds Latência por etapa, do início do sinal até o commit da letra.",
+                "# TYPE libras_sign_latency_seconds histogram",
+            ]
+            for (letter, stage), histogram in sorted(self.latency.items()):
+                lines += self._render_histogram("libras_sign_latency_seconds", {"letter": letter, "stage": stage}, histogram)
+
+            lines += [
+                "# HELP libras_frame_seconds Intervalo entre frames e tempo de processamento por frame.",
+                "# TYPE libras_frame_seconds histogram",
+            ]
+            for kind, histogram in sorted(self.frame.items()):
+                lines += self._render_histogram("libras_frame_seconds", {"kind": kind}, histogram)
+
+            for name, help_text, values in (
+                ("libras_letter_commits_total", "Letras adicionadas ao nome.", self.commits),
+                ("libras_false_commits_total", "Letras adicionadas e depois apagadas pelo jogador.", self.false_commits),
+                ("libras_abandoned_confirmations_total", "Letras confirmadas que não chegaram ao nome.", self.abandoned),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for letter, count in sorted(values.items()):
+                    lines.append(f"{name}{_format_labels({'letter': letter})} {count}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histogram(name: str, labels: Dict[str, str], histogram: Histogram) -> List[str]:
+        lines = []
+        for bound, count in histogram.cumulative():
+            lines.append(f"{name}_bucket{_format_labels(dict(labels, le=_format_bound(bound)))} {count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum!r}")
+        lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return lines
+
+    def flush(self):
+        """Grava o arquivo de métricas (substituição atômica)"""
+        self.last_flush = time.monotonic()
+        if not self.path:
+            return
+        if not self.rotated:
+            # A primeira gravação da sessão preserva o arquivo da sessão anterior
+            rotate_files(self.path, self.backups)
+            self.rotated = True
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Erro ao gravar métricas em {self.path}: {e}")
+
+    def maybe_flush(self):
+        if time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+# ============== Relatório offline ==============
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)')
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+def parse_metrics(lines: Iterable[str]) -> List[Tuple[str, Dict[str, str], float]]:
+    samples = []
+    for line in lines:
+        if not line.strip() or line.startswith("#"):
+            continue
+        match = _SAMPLE.match(line)
+        if match is None:
+            continue
+        name, labels, value = match.groups()
+        parsed = {k: re.sub(r'\\(.)', lambda m: "\n" if m.group(1) == "n" else m.group(1), v)
+                  for k, v in _LABEL.findall(labels or "")}
+        samples.append((name, parsed, float(value)))
+    return samples
+
+def histogram_quantile(q: float, buckets: List[Tuple[float, float]]) -> float:
+    """Quantil estimado por interpolação linear dentro do bucket (como no PromQL)"""
+    buckets = sorted(buckets)
+    total = buckets[-1][1] if buckets else 0
+    if total == 0:
+        return float("nan")
+    rank = q * total
+    previous_bound, previous_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= rank:
+            if bound == float("inf"):
+                return previous_bound
+            if count == previous_count:
+                return bound
+            return previous_bound + (bound - previous_bound) * (rank - previous_count) / (count - previous_count)
+        previous_bound, previous_count = bound, count
+    return previous_bound
+
+def load_report(paths: Iterable[str]) -> Dict[str, object]:
+    """Soma as sessões dos arquivos (mesmos buckets) por letra, etapa e contador"""
+    latency: Dict[Tuple[str, str], Dict[float, float]] = {}
+    latency_sum: Dict[Tuple[str, str], float] = {}
+    frame: Dict[str, Dict[float, float]] = {}
+    counters: Dict[str, Dict[str, float]] = {}
+    config: Dict[str, float] = {}
+    sessions = 0
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            samples = parse_metrics(f)
+        sessions += 1
+        for name, labels, value in samples:
+            if name == "libras_sign_latency_seconds_bucket":
+                buckets = latency.setdefault((labels["letter"], labels["stage"]), {})
+                bound = float(labels["le"])
+                buckets[bound] = buckets.get(bound, 0) + value
+            elif name == "libras_sign_latency_seconds_sum":
+                key = (labels["letter"], labels["stage"])
+                latency_sum[key] = latency_sum.get(key, 0.0) + value
+            elif name == "libras_frame_seconds_bucket":
+                buckets = frame.setdefault(labels["kind"], {})
+                bound = float(labels["le"])
+                buckets[bound] = buckets.get(bound, 0) + value
+            elif name.endswith("_total"):
+                per_letter = counters.setdefault(name, {})
+                per_letter[labels["letter"]] = per_letter.get(labels["letter"], 0) + value
+            elif name == "libras_config":
+                config[labels["name"]] = value # Vale a da última sessão lida
+    return {"latency": latency, "latency_sum": latency_sum, "frame": frame,
+            "counters": counters, "config": config, "sessions": sessions}
+
+def print_report(report: Dict[str, object], quantiles: Tuple[float, ...] = (0.5, 0.9, 0.99)):
+    header_q = "".join(f"{'p' + format(q * 100, 'g'):>8}" for q in quantiles)
+    print(f"Sessões: {report['sessions']}")
+    if report["config"]:
+        print("Configuração: " + ", ".join(f"{k}={v:g}" for k, v in sorted(report["config"].items())))
+
+    for kind, buckets in sorted(report["frame"].items()):
+        items = list(buckets.items())
+        values = " ".join(f"p{q * 100:g}={histogram_quantile(q, items) * 1000:.1f}ms" for q in quantiles)
+        print(f"Frame ({kind}): {values}")
+
+    letters = sorted({letter for letter, _ in report["latency"]} |
+                     {letter for counts in report["counters"].values() for letter in counts})
+    for stage, _, _ in STAGES:
+        rows = [(letter, report["latency"][(letter, stage)]) for letter in letters if (letter, stage) in report["latency"]]
+        if not rows:
+            continue
+        print(f"\nEtapa: {stage} (segundos)")
+        print(f"{'letra':>6}{'n':>6}{'média':>8}{header_q}")
+        for letter, buckets in rows:
+            items = list(buckets.items())
+            n = max(count for _, count in items)
+            mean = report["latency_sum"].get((letter, stage), 0.0) / n if n else float("nan")
+            print(f"{letter:>6}{n:>6.0f}{mean:>8.2f}" + "".join(f"{histogram_quantile(q, items):>8.2f}" for q in quantiles))
+
+    counters = report["counters"]
+    if letters:
+        print(f"\n{'letra':>6}{'commits':>9}{'apagadas':>10}{'abandonadas':>13}{'% erro':>8}")
+        for letter in letters:
+            commits = counters.get("libras_letter_commits_total", {}).get(letter, 0)
+            false = counters.get("libras_false_commits_total", {}).get(letter, 0)
+            abandoned = counters.get("libras_abandoned_confirmations_total", {}).get(letter, 0)
+            rate = f"{false / commits * 100:.0f}%" if commits else "-"
+            print(f"{letter:>6}{commits:>9.0f}{false:>10.0f}{abandoned:>13.0f}{rate:>8}")
+
+def default_metrics_files(path: str = METRICS_PATH) -> List[str]:
+    """O arquivo da sessão atual e os rotacionados (.1, .2, ...) que existirem"""
+    files = [path] if os.path.exists(path) else []
+    i = 1
+    while os.path.exists(f"{path}.{i}"):
+        files.append(f"{path}.{i}")
+        i += 1
+    return files
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Relatório por letra das latências de soletração (percentis).")
+    parser.add_argument("files", nargs="*", help=f"Arquivos de métricas (padrão: {METRICS_PATH} e rotacionados)")
+    args = parser.parse_args()
+
+    files = args.files or default_metrics_files()
+    if not files:
+        print(f"Nenhum arquivo de métricas encontrado ({METRICS_PATH}). Jogue uma sessão primeiro.")
+        sys.exit(1)
+    print_report(load_report(files))
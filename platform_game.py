@@ -0,0 +1,513 @@
+import os
+import struct
+import zlib
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
+import pygame
+
+# ============== Motor de plataforma ==============
+# Fases em grade de tiles (arquivo compacto), colisões de entidades por
+# spatial hash em grade uniforme e desenho só do que está na câmera, com os
+# tiles pré-desenhados em superfícies por chunk.
+
+TILE_SIZE = 32
+CHUNK_TILES = 16 # Chunk de 16x16 tiles = superfície de 512x512
+MAX_CACHED_CHUNKS = 48
+
+TILE_EMPTY = 0
+TILE_GROUND = 1
+TILE_PLATFORM = 2
+
+TILE_COLORS = {
+    TILE_GROUND: (139, 90, 43),
+    TILE_PLATFORM: (80, 180, 255),
+}
+SKY_COLOR = (30, 30, 40)
+
+# Símbolos do formato texto (.txt), editável à mão
+ASCII_TILES = {'.': TILE_EMPTY, ' ': TILE_EMPTY, '#': TILE_GROUND, '=': TILE_PLATFORM}
+ASCII_SPAWNS = {'P': "player", 'E': "enemy", '*': "pickup"}
+
+# Formato binário (.lvl): cabeçalho, tiles uint8 comprimidos com zlib e
+# lista de spawns (tipo, tile x, tile y)
+LEVEL_MAGIC = b"CLVL"
+LEVEL_VERSION = 1
+LEVEL_HEADER = struct.Struct("<4sBHII") # magic, versão, tamanho do tile, largura, altura
+LEVEL_COUNT = struct.Struct("<I")
+LEVEL_SPAWN = struct.Struct("<BII")
+SPAWN_KINDS = ["player", "enemy", "pickup"]
+
+# Física do jogador (mesmos valores do placeholder anterior)
+PLAYER_SIZE = (28, 40)
+PLAYER_SPEED = 300 # px/s
+PLAYER_JUMP_POWER = -720 # px/s
+GRAVITY = 2160 # px/s²
+MAX_FALL_SPEED = 1200 # px/s
+ENEMY_SPEED = 90 # px/s
+INTERACT_RANGE = TILE_SIZE * 1.5
+
+class Level:
+    """Mapa de tiles (uint8, linhas x colunas) e posições iniciais das entidades"""
+
+    def __init__(self, tiles: np.ndarray, spawns: List[Tuple[str, int, int]], tile_size: int = TILE_SIZE):
+        self.tiles = np.ascontiguousarray(tiles, dtype=np.uint8)
+        self.spawns = spawns
+        self.tile_size = tile_size
+        self.height, self.width = self.tiles.shape
+        self.pixel_width = self.width * tile_size
+        self.pixel_height = self.height * tile_size
+
+    @classmethod
+    def from_ascii(cls, lines: List[str]) -> "Level":
+        # Linhas só com espaços são linhas vazias válidas (' ' é um tile); só "" é ignorada
+        lines = [line.rstrip("\r\n") for line in lines]
+        lines = [line for line in lines if line != ""]
+        width = max(len(line) for line in lines)
+        tiles = np.zeros((len(lines), width), dtype=np.uint8)
+        spawns = []
+        for ty, line in enumerate(lines):
+            for tx, char in enumerate(line):
+                if char in ASCII_SPAWNS:
+                    spawns.append((ASCII_SPAWNS[char], tx, ty))
+                else:
+                    tiles[ty, tx] = ASCII_TILES.get(char, TILE_EMPTY)
+        return cls(tiles, spawns)
+
+    @classmethod
+    def load(cls, path: str) -> "Level":
+        if path.endswith(".txt"):
+            with open(path, encoding="utf-8") as f:
+                return cls.from_ascii(f.readlines())
+
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, tile_size, width, height = LEVEL_HEADER.unpack_from(data)
+        if magic != LEVEL_MAGIC or version != LEVEL_VERSION:
+            raise ValueError(f"Arquivo de fase inválido: {path}")
+        offset = LEVEL_HEADER.size
+        size, = LEVEL_COUNT.unpack_from(data, offset)
+        offset += LEVEL_COUNT.size
+        tiles = np.frombuffer(zlib.decompress(data[offset:offset + size]), dtype=np.uint8).reshape(height, width)
+        offset += size
+        count, = LEVEL_COUNT.unpack_from(data, offset)
+        offset += LEVEL_COUNT.size
+        spawns = []
+        for kind, tx, ty in LEVEL_SPAWN.iter_unpack(data[offset:offset + count * LEVEL_SPAWN.size]):
+            spawns.append((SPAWN_KINDS[kind], tx, ty))
+        return cls(tiles, spawns, tile_size)
+
+    def save(self, path: str):
+        compressed = zlib.compress(self.tiles.tobytes(), 9)
+        parts = [
+            LEVEL_HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, self.tile_size, self.width, self.height),
+            LEVEL_COUNT.pack(len(compressed)),
+            compressed,
+            LEVEL_COUNT.pack(len(self.spawns)),
+        ]
+        parts.extend(LEVEL_SPAWN.pack(SPAWN_KINDS.index(kind), tx, ty) for kind, tx, ty in self.spawns)
+        with open(path, "wb") as f:
+            f.write(b"".join(parts))
+
+    @classmethod
+    def generate(cls, width: int, height: int, enemies: int, pickups: int, seed: int = 0) -> "Level":
+        """Fase procedural com chão irregular, buracos e plataformas (usada no benchmark)"""
+        rng = np.random.default_rng(seed)
+        tiles = np.zeros((height, width), dtype=np.uint8)
+        ground = np.clip(height - 4 + np.cumsum(rng.integers(-1, 2, width)) // 4, height // 2, height - 2)
+        for tx in range(width):
+            if tx > 8 and rng.random() < 0.03:
+                continue # buraco
+            tiles[ground[tx]:, tx] = TILE_GROUND
+        for _ in range(width // 6):
+            tx = int(rng.integers(0, width - 8))
+            ty = int(rng.integers(4, max(5, ground[tx] - 3)))
+            tiles[ty, tx:tx + int(rng.integers(3, 8))] = TILE_PLATFORM
+
+        spawns = [("player", 2, int(ground[2]) - 2)]
+        for kind, count in (("enemy", enemies), ("pickup", pickups)):
+            for tx in rng.integers(10, width - 1, count):
+                spawns.append((kind, int(tx), int(ground[tx]) - 1))
+        return cls(tiles, spawns)
+
+    def is_solid_area(self, tx0: int, ty0: int, tx1: int, ty1: int) -> bool:
+        """Há tile sólido no retângulo de tiles [tx0, tx1] x [ty0, ty1]? Fora das laterais conta como parede."""
+        if tx0 < 0 or tx1 >= self.width:
+            return True
+        ty0 = max(ty0, 0)
+        ty1 = min(ty1, self.height - 1)
+        if ty0 > ty1:
+            return False
+        return bool(self.tiles[ty0:ty1 + 1, tx0:tx1 + 1].any())
+
+class Entity:
+    __slots__ = ("kind", "x", "y", "width", "height", "velocity_x", "alive", "cells")
+
+    def __init__(self, kind: str, x: float, y: float, width: int, height: int, velocity_x: float = 0.0):
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.velocity_x = velocity_x
+        self.alive = True
+        self.cells: Tuple[int, int, int, int] = (0, 0, -1, -1)
+
+    def overlaps(self, x: float, y: float, width: float, height: float) -> bool:
+        return self.x < x + width and x < self.x + self.width and self.y < y + height and y < self.y + self.height
+
+class SpatialHash:
+    """Grade uniforme: cada célula guarda as entidades cujo retângulo a toca"""
+
+    def __init__(self, cell_size: int = TILE_SIZE * 4):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Set[Entity]] = {}
+
+    def _cell_range(self, x: float, y: float, width: float, height: float) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return int(x // size), int(y // size), int((x + width) // size), int((y + height) // size)
+
+    def insert(self, entity: Entity):
+        entity.cells = self._cell_range(entity.x, entity.y, entity.width, entity.height)
+        cx0, cy0, cx1, cy1 = entity.cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells.setdefault((cx, cy), set()).add(entity)
+
+    def remove(self, entity: Entity):
+        cx0, cy0, cx1, cy1 = entity.cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(entity)
+                    if not bucket:
+                        del self.cells[(cx, cy)]
+        entity.cells = (0, 0, -1, -1)
+
+    def update(self, entity: Entity):
+        """Reposiciona a entidade só se ela mudou de célula"""
+        if self._cell_range(entity.x, entity.y, entity.width, entity.height) != entity.cells:
+            self.remove(entity)
+            self.insert(entity)
+
+    def query(self, x: float, y: float, width: float, height: float) -> Set[Entity]:
+        cx0, cy0, cx1, cy1 = self._cell_range(x, y, width, height)
+        found: Set[Entity] = set()
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
+
+class ChunkRenderer:
+    """Desenha os tiles em superfícies de chunk sob demanda e guarda as mais recentes (LRU)"""
+
+    def __init__(self, level: Level, max_chunks: int = MAX_CACHED_CHUNKS):
+        self.level = level
+        self.max_chunks = max_chunks
+        self.chunk_pixels = CHUNK_TILES * level.tile_size
+        self.chunks: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()
+        self.chunks_built = 0
+
+    def _build_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        size = self.level.tile_size
+        surface = pygame.Surface((self.chunk_pixels, self.chunk_pixels))
+        surface.fill(SKY_COLOR)
+        tx0, ty0 = cx * CHUNK_TILES, cy * CHUNK_TILES
+        block = self.level.tiles[ty0:ty0 + CHUNK_TILES, tx0:tx0 + CHUNK_TILES]
+        for ty, tx in zip(*np.nonzero(block)):
+            surface.fill(TILE_COLORS.get(int(block[ty, tx]), (255, 0, 255)), (tx * size, ty * size, size, size))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        self.chunks_built += 1
+        return surface
+
+    def get_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        key = (cx, cy)
+        surface = self.chunks.get(key)
+        if surface is None:
+            surface = self._build_chunk(cx, cy)
+            self.chunks[key] = surface
+            if len(self.chunks) > self.max_chunks:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(key)
+        return surface
+
+    def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float):
+        view_width, view_height = screen.get_size()
+        chunk = self.chunk_pixels
+        cx0 = max(0, int(camera_x // chunk))
+        cy0 = max(0, int(camera_y // chunk))
+        cx1 = min((self.level.width - 1) // CHUNK_TILES, int((camera_x + view_width) // chunk))
+        cy1 = min((self.level.height - 1) // CHUNK_TILES, int((camera_y + view_height) // chunk))
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                screen.blit(self.get_chunk(cx, cy), (int(cx * chunk - camera_x), int(cy * chunk - camera_y)))
+
+class PlatformGame:
+    """Estado de plataforma do jogo: fase em tiles, jogador, inimigos e mudas para plantar"""
+
+    def __init__(self, screen=None, level_path: Optional[str] = None, level: Optional[Level] = None):
+        self.screen = screen
+        if level is None:
+            level = Level.load(level_path or os.path.join(os.path.dirname(os.path.abspath(__file__)), "levels", "fase1.txt"))
+        self.level = level
+        self.renderer = ChunkRenderer(level)
+        self.font = pygame.font.Font(None, 28)
+        self.hud_cache: Dict[str, pygame.Surface] = {}
+        self.reset()
+
+    def reset(self):
+        size = self.level.tile_size
+        self.entities = SpatialHash()
+        self.enemies: List[Entity] = []
+        self.start = (size * 2.0, 0.0)
+        for kind, tx, ty in self.level.spawns:
+            if kind == "player":
+                self.start = (tx * size + (size - PLAYER_SIZE[0]) / 2, (ty + 1) * size - PLAYER_SIZE[1])
+            elif kind == "enemy":
+                enemy = Entity("enemy", tx * size + 2, (ty + 1) * size - 24, size - 4, 24, -ENEMY_SPEED)
+                self.enemies.append(enemy)
+                self.entities.insert(enemy)
+            elif kind == "pickup":
+                self.entities.insert(Entity("pickup", tx * size + 8, (ty + 1) * size - 20, 16, 20))
+
+        self.player_x, self.player_y = self.start
+        self.previous_player_x, self.previous_player_y = self.start
+        self.player_velocity_y = 0.0
+        self.on_ground = False
+        self.move_direction = 0
+        self.jump_requested = False
+        self.interact_requested = False
+        # Gestos ficam ativos enquanto o sinal é mantido; pulo e interação só na borda de subida
+        self.jump_gesture_held = False
+        self.interact_gesture_held = False
+        self.seeds_planted = 0
+        self.camera_x, self.camera_y = self._camera_target()
+        self.previous_camera_x, self.previous_camera_y = self.camera_x, self.camera_y
+
+    # ---------- Entrada ----------
+
+    def handle_input(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_UP, pygame.K_w, pygame.K_SPACE):
+                self.jump_requested = True
+            elif event.key == pygame.K_e:
+                self.interact_requested = True
+
+    def apply_commands(self, commands: Dict[str, object]):
+        """Mapeia os comandos de gesto (jump, move_left, move_right, interact) para ações do jogador"""
+        keys = pygame.key.get_pressed() if pygame.display.get_init() else None
+        left = bool(commands.get("move_left")) or bool(keys and (keys[pygame.K_LEFT] or keys[pygame.K_a]))
+        right = bool(commands.get("move_right")) or bool(keys and (keys[pygame.K_RIGHT] or keys[pygame.K_d]))
+        self.move_direction = int(right) - int(left)
+        jump, interact = bool(commands.get("jump")), bool(commands.get("interact"))
+        if jump and not self.jump_gesture_held:
+            self.jump_requested = True
+        if interact and not self.interact_gesture_held:
+            self.interact_requested = True
+        self.jump_gesture_held, self.interact_gesture_held = jump, interact
+
+    # ---------- Simulação ----------
+
+    def _move_player(self, dx: float, dy: float):
+        size = self.level.tile_size
+        width, height = PLAYER_SIZE
+
+        # Eixo x
+        self.player_x += dx
+        ty0, ty1 = int(self.player_y // size), int((self.player_y + height - 1e-6) // size)
+        if dx > 0:
+            tx = int((self.player_x + width - 1e-6) // size)
+            if self.level.is_solid_area(tx, ty0, tx, ty1):
+                self.player_x = tx * size - width
+        elif dx < 0:
+            tx = int(self.player_x // size)
+            if self.level.is_solid_area(tx, ty0, tx, ty1):
+                self.player_x = (tx + 1) * size
+
+        # Eixo y
+        if dy == 0:
+            return
+        self.player_y += dy
+        self.on_ground = False
+        tx0, tx1 = int(self.player_x // size), int((self.player_x + width - 1e-6) // size)
+        if dy > 0:
+            ty = int((self.player_y + height - 1e-6) // size)
+            if ty < self.level.height and self.level.is_solid_area(tx0, ty, tx1, ty):
+                self.player_y = ty * size - height
+                self.player_velocity_y = 0.0
+                self.on_ground = True
+        elif dy < 0:
+            ty = int(self.player_y // size)
+            if ty >= 0 and self.level.is_solid_area(tx0, ty, tx1, ty):
+                self.player_y = (ty + 1) * size
+                self.player_velocity_y = 0.0
+
+    def _update_enemies(self, dt: float):
+        # Só os inimigos perto da câmera são simulados; os demais ficam parados
+        view_width, view_height = self._view_size()
+        margin = view_width // 2
+        nearby = self.entities.query(self.camera_x - margin, self.camera_y - margin,
+                                     view_width + 2 * margin, view_height + 2 * margin)
+        size = self.level.tile_size
+        for enemy in nearby:
+            if enemy.kind != "enemy":
+                continue
+            new_x = enemy.x + enemy.velocity_x * dt
+            front = new_x if enemy.velocity_x < 0 else new_x + enemy.width
+            tx = int(front // size)
+            ty = int(enemy.y // size)
+            below = int((enemy.y + enemy.height) // size)
+            # Vira ao encontrar parede ou beira de buraco
+            if self.level.is_solid_area(tx, ty, tx, ty) or not self.level.is_solid_area(tx, below, tx, below):
+                enemy.velocity_x = -enemy.velocity_x
+            else:
+                enemy.x = new_x
+                self.entities.update(enemy)
+
+    def _handle_collisions(self):
+        width, height = PLAYER_SIZE
+        for entity in self.entities.query(self.player_x, self.player_y, width, height):
+            if entity.kind == "enemy" and entity.overlaps(self.player_x, self.player_y, width, height):
+                self._respawn()
+                return
+
+        if self.interact_requested:
+            reach = INTERACT_RANGE
+            area = (self.player_x - reach, self.player_y - reach, width + 2 * reach, height + 2 * reach)
+            for entity in self.entities.query(*area):
+                if entity.kind == "pickup" and entity.overlaps(*area):
+                    self.entities.remove(entity)
+                    entity.alive = False
+                    self.seeds_planted += 1
+        self.interact_requested = False
+
+    def _respawn(self):
+        self.player_x, self.player_y = self.start
+        self.previous_player_x, self.previous_player_y = self.start
+        self.player_velocity_y = 0.0
+
+    def update(self, dt: float):
+        """Avança um passo fixo de `dt` segundos"""
+        self.previous_player_x, self.previous_player_y = self.player_x, self.player_y
+        self.previous_camera_x, self.previous_camera_y = self.camera_x, self.camera_y
+
+        if self.jump_requested and self.on_ground:
+            self.player_velocity_y = PLAYER_JUMP_POWER
+        self.jump_requested = False
+
+        self.player_velocity_y = min(self.player_velocity_y + GRAVITY * dt, MAX_FALL_SPEED)
+        self._move_player(self.move_direction * PLAYER_SPEED * dt, 0.0)
+        self._move_player(0.0, self.player_velocity_y * dt)
+        if self.player_y > self.level.pixel_height:
+            self._respawn()
+
+        self._update_enemies(dt)
+        self._handle_collisions()
+        self.camera_x, self.camera_y = self._camera_target()
+
+    # ---------- Desenho ----------
+
+    def _view_size(self) -> Tuple[int, int]:
+        screen = pygame.display.get_surface() or self.screen
+        return screen.get_size() if screen is not None else (1024, 768)
+
+    def _camera_target(self) -> Tuple[float, float]:
+        view_width, view_height = self._view_size()
+        x = self.player_x + PLAYER_SIZE[0] / 2 - view_width / 2
+        y = self.player_y + PLAYER_SIZE[1] / 2 - view_height / 2
+        x = min(max(x, 0.0), max(0.0, self.level.pixel_width - view_width))
+        y = min(max(y, 0.0), max(0.0, self.level.pixel_height - view_height))
+        return x, y
+
+    def _hud_text(self, text: str) -> pygame.Surface:
+        surface = self.hud_cache.get(text)
+        if surface is None:
+            if len(self.hud_cache) > 32:
+                self.hud_cache.clear()
+            surface = self.font.render(text, True, (255, 255, 255))
+            self.hud_cache[text] = surface
+        return surface
+
+    def draw(self, alpha: float = 1.0):
+        screen = pygame.display.get_surface()
+        camera_x = self.previous_camera_x + (self.camera_x - self.previous_camera_x) * alpha
+        camera_y = self.previous_camera_y + (self.camera_y - self.previous_camera_y) * alpha
+        view_width, view_height = screen.get_size()
+
+        screen.fill(SKY_COLOR)
+        self.renderer.draw(screen, camera_x, camera_y)
+
+        for entity in self.entities.query(camera_x, camera_y, view_width, view_height):
+            color = (255, 90, 30) if entity.kind == "enemy" else (60, 220, 90)
+            pygame.draw.rect(screen, color, (int(entity.x - camera_x), int(entity.y - camera_y), entity.width, entity.height))
+
+        player_x = self.previous_player_x + (self.player_x - self.previous_player_x) * alpha
+        player_y = self.previous_player_y + (self.player_y - self.previous_player_y) * alpha
+        pygame.draw.rect(screen, (255, 220, 50), (int(player_x - camera_x), int(player_y - camera_y), *PLAYER_SIZE))
+
+        screen.blit(self._hud_text("Plataforma (ESC volta ao menu)"), (20, 20))
+        screen.blit(self._hud_text(f"Mudas plantadas: {self.seeds_planted}"), (20, 48))
+
+# ============== Benchmark headless ==============
+
+def benchmark(width: int = 2000, height: int = 64, enemies: int = 800, pickups: int = 400,
+              frames: int = 600, dt: float = 1 / 60) -> Dict[str, float]:
+    """Percorre uma fase grande com o jogador correndo e pulando, medindo update e draw por frame"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((1024, 768))
+
+    import tempfile
+    level = Level.generate(width, height, enemies, pickups)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.lvl")
+        level.save(path)
+        file_size = os.path.getsize(path)
+        start = time.perf_counter()
+        level = Level.load(path)
+        load_ms = (time.perf_counter() - start) * 1000
+
+    game = PlatformGame(level=level)
+    frame_times = []
+    for i in range(frames):
+        start = time.perf_counter()
+        game.apply_commands({"move_right": True, "jump": i % 45 == 0, "interact": i % 10 == 0})
+        game.update(dt)
+        game.draw(0.5)
+        frame_times.append(time.perf_counter() - start)
+
+    frame_ms = np.array(frame_times) * 1000
+    return {
+        "tiles": width * height,
+        "entities": enemies + pickups,
+        "file_bytes": file_size,
+        "load_ms": load_ms,
+        "mean_frame_ms": float(frame_ms.mean()),
+        "p99_frame_ms": float(np.percentile(frame_ms, 99)),
+        "fps_equivalent": float(1000 / frame_ms.mean()),
+        "chunks_built": game.renderer.chunks_built,
+    }
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark headless do motor de plataforma.")
+    parser.add_argument("--width", type=int, default=2000)
+    parser.add_argument("--height", type=int, default=64)
+    parser.add_argument("--enemies", type=int, default=800)
+    parser.add_argument("--pickups", type=int, default=400)
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    result = benchmark(args.width, args.height, args.enemies, args.pickups, args.frames)
+    print(f"Fase: {result['tiles']} tiles, {result['entities']} entidades, "
+          f"{result['file_bytes']} bytes em disco, carregada em {result['load_ms']:.1f}ms")
+    print(f"Frame (update + draw): média {result['mean_frame_ms']:.2f}ms, p99 {result['p99_frame_ms']:.2f}ms "
+          f"(~{result['fps_equivalent']:.0f} FPS), {result['chunks_built']} chunks desenhados")